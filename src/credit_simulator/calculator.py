@@ -6,17 +6,23 @@ full precision for all intermediate steps.
 """
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from typing import Iterator, Optional
 
 from .config import CENT, ZERO
 
+_APR_Q = Decimal("0.000001")  # APR is reported to 6 decimal places (0.0001 %)
+_MONTHS_PER_YEAR = Decimal(12)
+
 
 def _round(value: Decimal) -> Decimal:
-    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+    return value.quantize(CENT, ROUND_HALF_UP)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AmortizationRow:
     period: int
     opening_balance: Decimal
@@ -46,6 +52,7 @@ class LoanPlan:
     effective_annual_rate: Decimal  # APR
 
 
+@lru_cache(maxsize=2048)
 def compute_emi(
     principal: Decimal,
     annual_rate: Decimal,
@@ -64,46 +71,47 @@ def compute_emi(
         raise ValueError("principal must be >= 0")
 
     if annual_rate == ZERO:
-        return _round(principal / Decimal(duration_months))
+        return _round(principal / duration_months)
 
-    r = annual_rate / Decimal(12)
-    n = Decimal(duration_months)
-    factor = (1 + r) ** int(duration_months)  # stays Decimal arithmetic
+    r = annual_rate / _MONTHS_PER_YEAR
+    # Decimal power with an int exponent runs under the context precision
+    # (bounded mantissa) and is fast enough that a float detour is not needed.
+    factor = (1 + r) ** duration_months
     emi = principal * r * factor / (factor - 1)
     return _round(emi)
 
 
+@lru_cache(maxsize=2048)
 def compute_monthly_insurance(
     original_principal: Decimal,
     annual_insurance_rate: Decimal,
 ) -> Decimal:
     """Fixed monthly insurance = original_principal * annual_rate / 12."""
-    return _round(original_principal * annual_insurance_rate / Decimal(12))
+    return _round(original_principal * annual_insurance_rate / _MONTHS_PER_YEAR)
 
 
+@lru_cache(maxsize=1024)
 def compute_loan_plan(
     principal: Decimal,
     annual_interest_rate: Decimal,
     annual_insurance_rate: Decimal,
     duration_months: int,
 ) -> LoanPlan:
-    """Compute the full loan plan summary (no amortization schedule)."""
+    """Compute the full loan plan summary (no amortization schedule).
+
+    Results are memoised on the four inputs; LoanPlan is frozen, so a cached
+    instance is safe to share between callers.
+    """
     emi = compute_emi(principal, annual_interest_rate, duration_months)
     monthly_insurance = compute_monthly_insurance(principal, annual_insurance_rate)
     monthly_installment = _round(emi + monthly_insurance)
 
     # First month interest component
-    r = annual_interest_rate / Decimal(12)
+    r = annual_interest_rate / _MONTHS_PER_YEAR
     monthly_interest_first = _round(principal * r)
 
-    # Total interest computed precisely via the amortization schedule to avoid accumulated rounding.
-    schedule = build_amortization_schedule(
-        principal, annual_interest_rate, annual_insurance_rate, duration_months
-    )
-    total_interest_paid = sum(
-        (row.interest_component for row in schedule), ZERO
-    )
-    total_insurance_paid = _round(monthly_insurance * Decimal(duration_months))
+    total_interest_paid = _total_interest(principal, r, emi, duration_months)
+    total_insurance_paid = _round(monthly_insurance * duration_months)
     total_cost_of_credit = _round(total_interest_paid + total_insurance_paid)
     total_repaid = _round(principal + total_cost_of_credit)
 
@@ -126,51 +134,130 @@ def compute_loan_plan(
     )
 
 
+def _balance_steps(
+    principal: Decimal,
+    monthly_rate: Decimal,
+    emi: Decimal,
+    duration_months: int,
+) -> Iterator[tuple[Decimal, Decimal, Decimal, Decimal]]:
+    """Yield (opening, interest, principal_component, closing) for each period.
+
+    This is the cent-rounded recurrence shared by _total_interest and
+    build_amortization_schedule: each period's interest is charged on the
+    previous rounded closing balance, principal never exceeds the opening
+    balance, and the last period pays off whatever balance remains.
+    """
+    # Hot loop: quantize inline with positional args bound to locals
+    # instead of going through _round() for every component.
+    cent, half_up = CENT, ROUND_HALF_UP
+    balance = principal
+    for _ in range(duration_months - 1):
+        interest = (balance * monthly_rate).quantize(cent, half_up)
+        principal_component = (emi - interest).quantize(cent, half_up)
+        if principal_component > balance:
+            # Guard against rounding making principal negative
+            principal_component = balance
+        closing = (balance - principal_component).quantize(cent, half_up)
+        yield balance, interest, principal_component, closing
+        balance = closing
+    yield balance, (balance * monthly_rate).quantize(cent, half_up), balance, ZERO
+
+
+def _total_interest(
+    principal: Decimal,
+    monthly_rate: Decimal,
+    emi: Decimal,
+    duration_months: int,
+) -> Decimal:
+    """Total interest over the loan term: the sum of the schedule's interest column."""
+    total = ZERO
+    for _, interest, _, _ in _balance_steps(principal, monthly_rate, emi, duration_months):
+        total += interest
+    return total
+
+
 def build_amortization_schedule(
     principal: Decimal,
     annual_interest_rate: Decimal,
     annual_insurance_rate: Decimal,
     duration_months: int,
+    *,
+    emi: Optional[Decimal] = None,
+    monthly_insurance: Optional[Decimal] = None,
 ) -> list[AmortizationRow]:
-    """Build the full month-by-month amortization schedule."""
-    emi = compute_emi(principal, annual_interest_rate, duration_months)
-    monthly_insurance = compute_monthly_insurance(principal, annual_insurance_rate)
+    """Build the full month-by-month amortization schedule.
+
+    Balances follow the cent-rounded recurrence of _balance_steps, which is
+    what keeps every regular row's installment exactly EMI + insurance.
+
+    Callers that already hold a LoanPlan may pass its monthly_emi and
+    monthly_insurance to skip recomputing them.
+    """
+    if emi is None:
+        emi = compute_emi(principal, annual_interest_rate, duration_months)
+    if monthly_insurance is None:
+        monthly_insurance = compute_monthly_insurance(principal, annual_insurance_rate)
     monthly_installment = _round(emi + monthly_insurance)
-    r = annual_interest_rate / Decimal(12)
+    r = annual_interest_rate / _MONTHS_PER_YEAR
+    cent, half_up = CENT, ROUND_HALF_UP
 
     rows: list[AmortizationRow] = []
-    balance = principal
-
-    for period in range(1, duration_months + 1):
-        opening = balance
-        interest = _round(opening * r)
-        # On the last period, pay off the exact remaining balance to avoid
-        # sub-cent rounding residue.
-        if period == duration_months:
-            principal_component = opening
+    append = rows.append
+    steps = _balance_steps(principal, r, emi, duration_months)
+    for period, (opening, interest, principal_component, closing) in enumerate(steps, 1):
+        if principal_component == opening:
+            # Final (or capped) row: pay off the exact remaining balance to
+            # avoid sub-cent rounding residue.
+            row_installment = (principal_component + interest + monthly_insurance).quantize(cent, half_up)
         else:
-            principal_component = _round(emi - interest)
-            # Guard against rounding making principal negative
-            if principal_component > opening:
-                principal_component = opening
-        closing = _round(opening - principal_component)
-
-        rows.append(
+            # Regular rows pay exactly EMI + insurance.
+            row_installment = monthly_installment
+        append(
             AmortizationRow(
                 period=period,
                 opening_balance=opening,
-                monthly_installment=_round(principal_component + interest + monthly_insurance),
+                monthly_installment=row_installment,
                 principal_component=principal_component,
                 interest_component=interest,
                 insurance_component=monthly_insurance,
                 closing_balance=closing,
             )
         )
-        balance = closing
 
     return rows
 
 
+def _apr_monthly_rate(C: float, P: float, n: int) -> float:
+    """Solve C * (1 - (1+r)^-n) / r = P for the monthly rate r by Newton-Raphson.
+
+    C is the monthly payment, P the principal and n the number of payments.
+    Runs at most 15 iterations, stopping early once r moves by less than 1e-12;
+    on a zero derivative or overflow the last estimate is returned.
+    """
+    # Initial guess: first-order expansion of the annuity equation,
+    # C*n/P - 1 ≈ r*(n+1)/2, which starts Newton close to the root.
+    r = max(1e-9, (C * n / P - 1) * 2 / (n + 1))
+
+    for _ in range(15):
+        # f(r) = C * (1 - v) / r - P,  v = (1+r)^-n
+        try:
+            v = (1 + r) ** -n
+            f = C * (1 - v) / r - P
+            # f'(r) = C * (v * (1 + n*r/(1+r)) - 1) / r^2
+            df = C * (v * (1 + n * r / (1 + r)) - 1) / (r * r)
+            if df == 0:
+                break
+            r_new = r - f / df
+            if abs(r_new - r) < 1e-12:
+                r = r_new
+                break
+            r = r_new
+        except (ZeroDivisionError, OverflowError):
+            break
+
+    return r
+
+
 def compute_apr(
     principal: Decimal,
     monthly_installment: Decimal,
@@ -182,36 +269,17 @@ def compute_apr(
 
     Returns the annualised rate (monthly_rate * 12).
     No bank fees are included (per spec §9, Q4 closed: no arrangement fees).
+    Returns ZERO when the installments repay no more than the principal
+    (zero-rate plans, or a sub-principal total with no positive root), and
+    when the iteration does not settle on a finite positive rate.
     """
     if principal <= ZERO or monthly_installment <= ZERO:
         return ZERO
+    if monthly_installment * duration_months <= principal:
+        return ZERO
 
-    C = float(monthly_installment)
-    P = float(principal)
-    n = duration_months
-
-    # Initial guess: nominal monthly rate
-    r = C / P / n  # rough starting point
-
-    for _ in range(100):
-        # f(r) = C * (1 - (1+r)^-n) / r - P
-        try:
-            factor = (1 + r) ** n
-            f = C * (factor - 1) / (r * factor) - P
-            # f'(r)
-            df = C * (
-                (n * (1 + r) ** (n - 1) * r * factor - (factor - 1) * (factor + r * n * (1 + r) ** (n - 1)))
-                / (r * factor) ** 2
-            )
-            if df == 0:
-                break
-            r_new = r - f / df
-            if abs(r_new - r) < 1e-12:
-                r = r_new
-                break
-            r = r_new
-        except (ZeroDivisionError, OverflowError):
-            break
+    r = _apr_monthly_rate(float(monthly_installment), float(principal), duration_months)
+    if not math.isfinite(r) or r <= 0:
+        return ZERO
 
-    annual_apr = Decimal(str(round(r * 12, 6)))
-    return annual_apr
+    return Decimal(r * 12).quantize(_APR_Q, ROUND_HALF_UP)
@@ -12,19 +12,21 @@ Update loop:
 """
 from __future__ import annotations
 
+import re
 import sys
-from decimal import Decimal, InvalidOperation
-from typing import Optional
+from dataclasses import astuple
+from decimal import Decimal
+from functools import lru_cache
+from typing import Callable, Optional
 
 import click
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich import box
 
 from .calculator import build_amortization_schedule
-from .fetcher import FetchError, fetch_rate
-from .config import DEFAULT_COUNTRY, DEFAULT_QUALITY, DEFAULT_LOAN_DURATION_MONTHS, VALID_PREFERENCES
+from .config import DEFAULT_COUNTRY, DEFAULT_QUALITY, DEFAULT_LOAN_DURATION_MONTHS, VALID_PREFERENCES, VALID_PREFERENCES_SORTED
 from .optimizer import OptimizedResult, SweetSpotAnalysis, optimize, analyze_sweet_spot
 from .profiles import (
     SUPPORTED_COUNTRIES,
@@ -40,14 +42,21 @@ err_console = Console(stderr=True, style="bold red")
 # Formatting helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Formatters are memoised: the same amounts (installment, insurance, ratios)
+# recur across the result, params, sweet-spot and schedule displays.
+# Equal Decimals (e.g. 1.5 and 1.50) share an entry; they format identically.
+
+@lru_cache(maxsize=4096)
 def _fmt_money(value: Decimal, currency: str) -> str:
     return f"{value:,.2f} {currency}"
 
 
+@lru_cache(maxsize=4096)
 def _fmt_pct(value: Decimal) -> str:
     return f"{float(value) * 100:.4f}%"
 
 
+@lru_cache(maxsize=4096)
 def _fmt_months(n: int) -> str:
     years, months = divmod(n, 12)
     if months == 0:
@@ -59,6 +68,36 @@ def _fmt_months(n: int) -> str:
 # Result display
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Column schemas: (header, add_column kwargs)
+_RESULT_COLUMNS = (
+    ("Field", {"style": "cyan"}),
+    ("Value", {"justify": "right"}),
+)
+_SCHEDULE_HEADERS = ("Period", "Opening Bal.", "Installment", "Principal", "Interest", "Insurance", "Closing Bal.")
+_SWEET_SPOT_COLUMNS = (
+    ("Milestone", {"style": "cyan", "min_width": 14, "max_width": 20}),
+    ("Down pmt", {"justify": "right", "min_width": 9}),
+    ("Rate", {"justify": "right", "min_width": 6}),
+    ("Monthly", {"justify": "right", "min_width": 7}),
+    ("DTI", {"justify": "right", "min_width": 4}),
+    ("LTV", {"justify": "right", "min_width": 4}),
+    ("Total cost", {"justify": "right", "min_width": 10}),
+    ("Liquidity", {"justify": "right", "min_width": 9}),
+)
+_PARAMS_COLUMNS = (
+    ("Parameter", {"style": "cyan"}),
+    ("Value", {"justify": "right"}),
+    ("Source", {"style": "dim"}),
+)
+
+
+def _make_table(columns: tuple, **table_kwargs) -> Table:
+    t = Table(**table_kwargs)
+    for header, options in columns:
+        t.add_column(header, **options)
+    return t
+
+
 def display_result(result: OptimizedResult) -> None:
     cur = result.currency
 
@@ -69,9 +108,7 @@ def display_result(result: OptimizedResult) -> None:
         expand=False,
     ))
 
-    t = Table(box=box.SIMPLE, show_header=False, padding=(0, 2))
-    t.add_column("Field", style="cyan")
-    t.add_column("Value", justify="right")
+    t = _make_table(_RESULT_COLUMNS, box=box.SIMPLE, show_header=False, padding=(0, 2))
 
     plan = result.plan
     t.add_row("Down payment", _fmt_money(result.down_payment, cur))
@@ -92,40 +129,57 @@ def display_result(result: OptimizedResult) -> None:
     console.print(t)
 
 
+def _render_schedule(schedule: list, currency: str) -> str:
+    """Format the schedule as a right-aligned plain-text table.
+
+    A Rich Table measures every cell on render, which takes ~0.3 s for a
+    30-year schedule; the columns here are sized in one pass instead.
+    """
+    cells = [_SCHEDULE_HEADERS]
+    for row in schedule:
+        cells.append((
+            str(row.period),
+            _fmt_money(row.opening_balance, currency),
+            _fmt_money(row.monthly_installment, currency),
+            _fmt_money(row.principal_component, currency),
+            _fmt_money(row.interest_component, currency),
+            _fmt_money(row.insurance_component, currency),
+            _fmt_money(row.closing_balance, currency),
+        ))
+    widths = [max(len(line[i]) for line in cells) for i in range(len(_SCHEDULE_HEADERS))]
+    lines = ["  ".join(cell.rjust(w) for cell, w in zip(line, widths)) for line in cells]
+    lines.insert(1, "  ".join("─" * w for w in widths))
+    return "\n".join(lines)
+
+
 def display_amortization(result: OptimizedResult) -> None:
     schedule = build_amortization_schedule(
         result.plan.loan_principal,
         result.plan.annual_interest_rate,
         result.plan.annual_insurance_rate,
         result.loan_duration_months,
+        emi=result.plan.monthly_emi,
+        monthly_insurance=result.plan.monthly_insurance,
     )
-    cur = result.currency
 
-    t = Table(title="Amortization Schedule", box=box.MINIMAL_HEAVY_HEAD)
-    for col in ("Period", "Opening Bal.", "Installment", "Principal", "Interest", "Insurance", "Closing Bal."):
-        t.add_column(col, justify="right")
-
-    for row in schedule:
-        t.add_row(
-            str(row.period),
-            _fmt_money(row.opening_balance, cur),
-            _fmt_money(row.monthly_installment, cur),
-            _fmt_money(row.principal_component, cur),
-            _fmt_money(row.interest_component, cur),
-            _fmt_money(row.insurance_component, cur),
-            _fmt_money(row.closing_balance, cur),
-        )
-    console.print(t)
+    console.print()
+    console.print("[bold]Amortization Schedule[/bold]")
+    console.print(
+        _render_schedule(schedule, result.currency),
+        highlight=False, markup=False, soft_wrap=True,
+    )
 
 
+@lru_cache(maxsize=4096)
 def _fmt_k(value: Decimal) -> str:
     """Format a monetary amount as compact integer (no currency, no decimals)."""
     return f"{value:,.0f}"
 
 
 def display_sweet_spot(analysis: SweetSpotAnalysis, currency: str) -> None:
-    console.print()
-    console.print(Panel(
+    # Collected into one Group so Rich renders and writes the section once.
+    parts: list = [""]
+    parts.append(Panel(
         f"[bold yellow]Down Payment Sweet-Spot Analysis[/bold yellow] "
         f"— {_fmt_months(analysis.duration_months)} — all amounts in {currency}",
         expand=False,
@@ -140,7 +194,7 @@ def display_sweet_spot(analysis: SweetSpotAnalysis, currency: str) -> None:
         if analysis.down_payment_is_efficient
         else "[yellow]INEFFICIENT — market beats the mortgage[/yellow]"
     )
-    console.print(
+    parts.append(
         f"  Marginal saving per extra 1 000 {currency} of down payment: "
         f"[bold]{saving_k} {currency}[/bold] in total cost over the loan term\n"
         f"  Effective yield (loan APR):  [bold]{yield_pct}[/bold]   "
@@ -148,15 +202,7 @@ def display_sweet_spot(analysis: SweetSpotAnalysis, currency: str) -> None:
     )
 
     # --- Milestone table ---
-    t = Table(box=box.SIMPLE_HEAVY, show_header=True, padding=(0, 1), expand=False)
-    t.add_column("Milestone", style="cyan", min_width=14, max_width=20)
-    t.add_column("Down pmt", justify="right", min_width=9)
-    t.add_column("Rate", justify="right", min_width=6)
-    t.add_column("Monthly", justify="right", min_width=7)
-    t.add_column("DTI", justify="right", min_width=4)
-    t.add_column("LTV", justify="right", min_width=4)
-    t.add_column("Total cost", justify="right", min_width=10)
-    t.add_column("Liquidity", justify="right", min_width=9)
+    t = _make_table(_SWEET_SPOT_COLUMNS, box=box.SIMPLE_HEAVY, show_header=True, padding=(0, 1), expand=False)
 
     for m in analysis.milestones:
         if m.is_sweet_spot:
@@ -176,18 +222,16 @@ def display_sweet_spot(analysis: SweetSpotAnalysis, currency: str) -> None:
             _fmt_k(m.savings_remaining),
         )
 
-    console.print(t)
-    console.print(f"[bold]Verdict:[/bold] {analysis.sweet_spot_reason}")
+    parts.append(t)
+    parts.append(f"[bold]Verdict:[/bold] {analysis.sweet_spot_reason}")
     if analysis.reserve_warning:
-        console.print(f"[yellow]{analysis.reserve_warning}[/yellow]")
-    console.print()
+        parts.append(f"[yellow]{analysis.reserve_warning}[/yellow]")
+    parts.append("")
+    console.print(Group(*parts))
 
 
 def display_params(inputs: UserInputs, params: ResolvedParams) -> None:
-    t = Table(title="Current Parameters", box=box.SIMPLE, show_header=True, padding=(0, 2))
-    t.add_column("Parameter", style="cyan")
-    t.add_column("Value", justify="right")
-    t.add_column("Source", style="dim")
+    t = _make_table(_PARAMS_COLUMNS, title="Current Parameters", box=box.SIMPLE, show_header=True, padding=(0, 2))
 
     cur = params.currency
 
@@ -218,12 +262,25 @@ def display_params(inputs: UserInputs, params: ResolvedParams) -> None:
 # Input helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Accept "1 234,56"-style input: comma becomes the decimal point, spaces drop out.
+_DEC_TRANS = str.maketrans({",": ".", " ": None})
+# Plain signed decimal literal — rejects NaN/Infinity/exponents before Decimal sees them.
+_DEC_RE = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)")
+
+
+def _parse_decimal(raw: str) -> Optional[Decimal]:
+    """Parse a user-typed number, or return None if it is not a plain decimal."""
+    cleaned = raw.translate(_DEC_TRANS)
+    if not _DEC_RE.fullmatch(cleaned):
+        return None
+    return Decimal(cleaned)
+
+
 def _prompt_decimal(prompt: str, *, positive: bool = True, allow_zero: bool = False) -> Decimal:
     while True:
         raw = console.input(f"[bold]{prompt}[/bold] ").strip()
-        try:
-            value = Decimal(raw.replace(",", ".").replace(" ", ""))
-        except InvalidOperation:
+        value = _parse_decimal(raw)
+        if value is None:
             err_console.print(f"  Invalid number: '{raw}'")
             continue
         if positive and value <= 0 and not (allow_zero and value == 0):
@@ -249,11 +306,12 @@ def _prompt_int(prompt: str, *, min_val: int = 1) -> int:
         return value
 
 
+_COUNTRY_PROMPT = f"[bold]Country code ({', '.join(sorted(SUPPORTED_COUNTRIES))}): [/bold]"
+
+
 def _prompt_country() -> str:
     while True:
-        raw = console.input(
-            f"[bold]Country code ({', '.join(sorted(SUPPORTED_COUNTRIES))}): [/bold]"
-        ).strip().upper()
+        raw = console.input(_COUNTRY_PROMPT).strip().upper()
         if raw in SUPPORTED_COUNTRIES:
             return raw
         err_console.print(f"  Unsupported country '{raw}'.")
@@ -268,8 +326,7 @@ def _prompt_quality() -> str:
 
 
 def _prompt_preference() -> str:
-    prefs = sorted(VALID_PREFERENCES)
-    console.print("  Preferences: " + ", ".join(prefs))
+    console.print("  Preferences: " + ", ".join(VALID_PREFERENCES_SORTED))
     while True:
         raw = console.input("[bold]Optimization preference: [/bold]").strip().lower()
         if raw in VALID_PREFERENCES:
@@ -281,38 +338,65 @@ def _prompt_preference() -> str:
 # Simulation runner
 # ──────────────────────────────────────────────────────────────────────────────
 
-def run_simulation(inputs: UserInputs, store: SessionProfileStore) -> Optional[tuple]:
-    """Resolve, check feasibility, optimize, and show sweet-spot analysis.
+@lru_cache(maxsize=8)
+def _simulate(inputs_key: tuple, store: SessionProfileStore, store_version: int) -> tuple:
+    """Computation half of run_simulation, memoised on inputs and store state.
 
-    Returns (params, result, analysis) on success, or None on any failure.
-    analysis may be None if the sweet-spot computation itself fails.
+    inputs_key is dataclasses.astuple(inputs); store_version is only part of
+    the cache key, so any store modification invalidates earlier entries.
+    Returns (params, result, analysis, failure) where failure is None or a
+    (stage, message) pair for the step that failed.
     """
+    inputs = UserInputs(*inputs_key)
     try:
         params = resolve(inputs, store)
     except ValueError as exc:
-        err_console.print(f"Parameter error: {exc}")
-        return None
+        return None, None, None, ("resolve", str(exc))
 
     try:
         check_feasibility(params)
     except InfeasibleError as exc:
-        console.print(Panel(f"[bold red]Ineligible[/bold red]\n{exc}", expand=False))
-        return None
+        return params, None, None, ("feasibility", str(exc))
 
     try:
         result = optimize(params)
     except ValueError as exc:
-        console.print(Panel(f"[bold red]No feasible plan found[/bold red]\n{exc}", expand=False))
+        return params, None, None, ("optimize", str(exc))
+
+    try:
+        analysis = analyze_sweet_spot(params)
+    except Exception as exc:
+        return params, result, None, ("sweet_spot", str(exc))
+
+    return params, result, analysis, None
+
+
+def run_simulation(inputs: UserInputs, store: SessionProfileStore) -> Optional[tuple]:
+    """Resolve, check feasibility, optimize, and show sweet-spot analysis.
+
+    Returns (params, result, analysis) on success, or None on any failure.
+    analysis may be None if the sweet-spot computation itself fails.
+    Re-running with unchanged inputs and store redisplays the cached outcome.
+    """
+    params, result, analysis, failure = _simulate(astuple(inputs), store, store.version)
+    stage, message = failure if failure else (None, "")
+
+    if stage == "resolve":
+        err_console.print(f"Parameter error: {message}")
+        return None
+    if stage == "feasibility":
+        console.print(Panel(f"[bold red]Ineligible[/bold red]\n{message}", expand=False))
+        return None
+    if stage == "optimize":
+        console.print(Panel(f"[bold red]No feasible plan found[/bold red]\n{message}", expand=False))
         return None
 
     display_result(result)
 
-    analysis: Optional[SweetSpotAnalysis] = None
-    try:
-        analysis = analyze_sweet_spot(params)
+    if stage == "sweet_spot":
+        err_console.print(f"Sweet-spot analysis failed: {message}")
+    else:
         display_sweet_spot(analysis, params.currency)
-    except Exception as exc:
-        err_console.print(f"Sweet-spot analysis failed: {exc}")
 
     return params, result, analysis
 
@@ -383,6 +467,10 @@ def _update_profile_manual(store: SessionProfileStore) -> None:
 
 
 def _update_profile_online(store: SessionProfileStore, inputs: UserInputs) -> None:
+    # Deferred: fetcher pulls in requests (~half of cli's import time) and is
+    # only needed when the user asks for an online update.
+    from .fetcher import FetchError, fetch_rate
+
     country = _prompt_country()
     console.print(f"  Fetching latest average annual rate for {country}…")
     try:
@@ -511,75 +599,63 @@ def interactive_loop(inputs: UserInputs, store: SessionProfileStore) -> None:
             err_console.print(f"  Unknown action '{action}'.")
 
 
+# field → prompt returning the new value (the attribute name is the field name)
+_UPDATE_PROMPTS: dict[str, Callable[[], object]] = {
+    "property_price": lambda: _prompt_decimal("New property price:", positive=True),
+    "country": _prompt_country,
+    "profile_quality": _prompt_quality,
+    "purchase_taxes": lambda: _prompt_decimal("New purchase taxes:", allow_zero=True, positive=False),
+    "annual_interest_rate": lambda: _prompt_decimal(
+        "New annual interest rate (e.g. 0.035):", positive=True
+    ),
+    "insurance_rate": lambda: _prompt_decimal(
+        "New insurance rate (e.g. 0.003):", allow_zero=True, positive=False
+    ),
+    "min_down_payment_ratio": lambda: _prompt_decimal(
+        "New min down payment ratio (e.g. 0.20):", allow_zero=True, positive=False
+    ),
+    "max_loan_duration_months": lambda: _prompt_int("New max loan duration (months):", min_val=12),
+    "fixed_loan_duration_months": lambda: _prompt_int("Fixed loan duration (months, e.g. 240 for 20y):", min_val=12),
+    "monthly_net_income": lambda: _prompt_decimal("New monthly net income:", positive=True),
+    "available_savings": lambda: _prompt_decimal("New available savings (maximum you can use for down payment):", allow_zero=True, positive=False),
+    "preferred_down_payment": lambda: _prompt_decimal("New preferred down payment:", allow_zero=True, positive=False),
+    "max_debt_ratio": lambda: _prompt_decimal(
+        "New max debt ratio (e.g. 0.35 for 35%):", allow_zero=False, positive=True
+    ),
+    "max_monthly_payment": lambda: _prompt_decimal("New max monthly payment:", positive=True),
+    "optimization_preference": _prompt_preference,
+}
+
+# field → value restored by 'reset' (None = fall back to the profile default)
+_RESET_VALUES: dict[str, object] = {
+    "country": None,
+    "profile_quality": None,
+    "purchase_taxes": None,
+    "annual_interest_rate": None,
+    "insurance_rate": None,
+    "min_down_payment_ratio": None,
+    "max_loan_duration_months": None,
+    "fixed_loan_duration_months": None,
+    "preferred_down_payment": None,
+    "max_debt_ratio": None,
+    "max_monthly_payment": None,
+    "optimization_preference": "balanced",
+}
+
+
 def _apply_update(field: str, inputs: UserInputs, store: SessionProfileStore) -> None:
+    prompt = _UPDATE_PROMPTS.get(field)
+    if prompt is None:
+        return
     try:
-        if field == "property_price":
-            inputs.property_price = _prompt_decimal("New property price:", positive=True)
-        elif field == "country":
-            inputs.country = _prompt_country()
-        elif field == "profile_quality":
-            inputs.profile_quality = _prompt_quality()  # type: ignore[assignment]
-        elif field == "purchase_taxes":
-            inputs.purchase_taxes = _prompt_decimal("New purchase taxes:", allow_zero=True, positive=False)
-        elif field == "annual_interest_rate":
-            inputs.annual_interest_rate = _prompt_decimal(
-                "New annual interest rate (e.g. 0.035):", positive=True
-            )
-        elif field == "insurance_rate":
-            inputs.insurance_rate = _prompt_decimal(
-                "New insurance rate (e.g. 0.003):", allow_zero=True, positive=False
-            )
-        elif field == "min_down_payment_ratio":
-            inputs.min_down_payment_ratio = _prompt_decimal(
-                "New min down payment ratio (e.g. 0.20):", allow_zero=True, positive=False
-            )
-        elif field == "max_loan_duration_months":
-            inputs.max_loan_duration_months = _prompt_int("New max loan duration (months):", min_val=12)
-        elif field == "fixed_loan_duration_months":
-            inputs.fixed_loan_duration_months = _prompt_int("Fixed loan duration (months, e.g. 240 for 20y):", min_val=12)
-        elif field == "monthly_net_income":
-            inputs.monthly_net_income = _prompt_decimal("New monthly net income:", positive=True)
-        elif field == "available_savings":
-            inputs.available_savings = _prompt_decimal("New available savings (maximum you can use for down payment):", allow_zero=True, positive=False)
-        elif field == "preferred_down_payment":
-            inputs.preferred_down_payment = _prompt_decimal("New preferred down payment:", allow_zero=True, positive=False)
-        elif field == "max_debt_ratio":
-            inputs.max_debt_ratio = _prompt_decimal(
-                "New max debt ratio (e.g. 0.35 for 35%):", allow_zero=False, positive=True
-            )
-        elif field == "max_monthly_payment":
-            inputs.max_monthly_payment = _prompt_decimal("New max monthly payment:", positive=True)
-        elif field == "optimization_preference":
-            inputs.optimization_preference = _prompt_preference()
+        setattr(inputs, field, prompt())
     except (KeyboardInterrupt, EOFError):
         console.print("\n  Update cancelled.")
 
 
 def _reset_field(field: str, inputs: UserInputs) -> None:
-    if field == "country":
-        inputs.country = None
-    elif field == "profile_quality":
-        inputs.profile_quality = None
-    elif field == "purchase_taxes":
-        inputs.purchase_taxes = None
-    elif field == "annual_interest_rate":
-        inputs.annual_interest_rate = None
-    elif field == "insurance_rate":
-        inputs.insurance_rate = None
-    elif field == "min_down_payment_ratio":
-        inputs.min_down_payment_ratio = None
-    elif field == "max_loan_duration_months":
-        inputs.max_loan_duration_months = None
-    elif field == "fixed_loan_duration_months":
-        inputs.fixed_loan_duration_months = None
-    elif field == "preferred_down_payment":
-        inputs.preferred_down_payment = None
-    elif field == "max_debt_ratio":
-        inputs.max_debt_ratio = None
-    elif field == "max_monthly_payment":
-        inputs.max_monthly_payment = None
-    elif field == "optimization_preference":
-        inputs.optimization_preference = "balanced"
+    if field in _RESET_VALUES:
+        setattr(inputs, field, _RESET_VALUES[field])
     else:
         err_console.print(f"  Field '{field}' cannot be reset (it is mandatory or derived).")
 
@@ -595,7 +671,7 @@ def _reset_field(field: str, inputs: UserInputs) -> None:
 @click.option("--purchase-taxes", type=str, default=None, help="Purchase taxes (overrides profile estimate)")
 @click.option("--country", type=str, default=None, help=f"Country code (default: {DEFAULT_COUNTRY})")
 @click.option("--quality", type=click.Choice(["average", "best"]), default=None, help="Profile quality")
-@click.option("--preference", type=click.Choice(list(VALID_PREFERENCES)), default="balanced", show_default=True)
+@click.option("--preference", type=click.Choice(VALID_PREFERENCES_SORTED), default="balanced", show_default=True)
 @click.option("--down-payment", type=str, default=None, help="Intended down payment amount. Omit to let the optimizer find the best within your savings.")
 @click.option("--duration", type=str, default=None, help="Loan duration: months (e.g. 240) or years (e.g. 20y). Default: 20y.")
 def main(
@@ -617,11 +693,11 @@ def main(
     def _parse_opt(s: Optional[str], name: str) -> Optional[Decimal]:
         if s is None:
             return None
-        try:
-            return Decimal(s.replace(",", ".").replace(" ", ""))
-        except InvalidOperation:
+        value = _parse_decimal(s)
+        if value is None:
             err_console.print(f"Invalid value for --{name}: '{s}'")
             sys.exit(1)
+        return value
 
     # Collect mandatory fields (from CLI args or interactive prompt)
     pp = _parse_opt(property_price, "property-price")
@@ -642,9 +718,8 @@ def main(
             "[bold]Purchase taxes? (press Enter to estimate from country profile): [/bold]"
         ).strip()
         if raw_pt:
-            try:
-                pt = Decimal(raw_pt.replace(",", ".").replace(" ", ""))
-            except InvalidOperation:
+            pt = _parse_decimal(raw_pt)
+            if pt is None:
                 err_console.print(f"  Invalid number: '{raw_pt}'. Will estimate from profile.")
 
     preferred_dp: Optional[Decimal] = _parse_opt(down_payment, "down-payment")
@@ -656,9 +731,8 @@ def main(
         except (EOFError, KeyboardInterrupt):
             raw_dp = ""
         if raw_dp:
-            try:
-                preferred_dp = Decimal(raw_dp.replace(",", ".").replace(" ", ""))
-            except InvalidOperation:
+            preferred_dp = _parse_decimal(raw_dp)
+            if preferred_dp is None:
                 err_console.print(f"  Invalid number: '{raw_dp}'. Will optimize automatically.")
 
     fixed_duration: Optional[int] = None
@@ -15,6 +15,7 @@ ProfileQuality = Literal["average", "best"]
 
 DEFAULT_COUNTRY: str = "BE"
 DEFAULT_QUALITY: ProfileQuality = "average"
+VALID_QUALITIES: tuple[ProfileQuality, ...] = ("average", "best")
 
 # ── Buyer constraint defaults ─────────────────────────────────────────────────
 
@@ -33,6 +34,7 @@ VALID_PREFERENCES: frozenset[str] = frozenset({
     "minimize_down_payment",
     "balanced",
 })
+VALID_PREFERENCES_SORTED: tuple[str, ...] = tuple(sorted(VALID_PREFERENCES))
 
 # ── Sweet-spot analysis thresholds ───────────────────────────────────────────
 
@@ -44,3 +46,4 @@ SWEET_SPOT_OPPORTUNITY_COST_RATE = Decimal("0.035")  # Annual benchmark return (
 
 ZERO = Decimal("0")
 CENT = Decimal("0.01")
+QUANT_BPS = Decimal("0.0001")  # ratios (LTV, DTI) are reported to 4 decimal places
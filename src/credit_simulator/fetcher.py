@@ -5,14 +5,36 @@ All fetches are user-triggered (no background polling).
 """
 from __future__ import annotations
 
+import json
 import os
+import time
 from decimal import Decimal
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Timeout for HTTP calls (seconds)
+# Timeouts for HTTP calls (seconds): (connect, read)
+_CONNECT_TIMEOUT = 3
 _TIMEOUT = 10
 
+
+def _make_session() -> requests.Session:
+    """Shared session: keep-alive connection pool plus a small retry budget
+    for transient gateway errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = "credit-simulator"
+    return session
+
+
+_SESSION = _make_session()
+
 # ECB country codes that use the MIR series
 # Note: BE is excluded — the ECB MIR endpoint for Belgium is unreliable;
 # use the manually maintained static rate in profiles.py instead.
@@ -40,6 +62,17 @@ _FRED_SERIES = "MORTGAGE30US"
 _FRED_URL = "https://api.stlouisfed.org/fred/series/observations"
 
 
+# Successful fetches are reused for this long (seconds). Sources publish
+# monthly (ECB, BoE) or weekly (FRED), so an hour never hides a new value
+# for long.
+_CACHE_TTL = 3600
+_RATE_CACHE: dict[str, tuple[float, Decimal]] = {}   # country -> (monotonic ts, rate)
+
+# HTTP validators (ETag / Last-Modified) from the last successful response of
+# each JSON source, so a re-fetch after the TTL can be answered with 304.
+_VALIDATORS: dict[str, tuple[dict[str, str], Decimal]] = {}   # country -> (headers, rate)
+
+
 class FetchError(Exception):
     """Raised when an online rate fetch fails for any reason."""
 
@@ -49,46 +82,77 @@ def fetch_rate(country: str) -> Decimal:
 
     Returns the rate as a Decimal fraction (e.g. 0.035 for 3.5%).
     Raises FetchError on any error (network, parsing, missing data).
+    Successful results are cached per country for _CACHE_TTL seconds.
     """
     code = country.upper()
+    now = time.monotonic()
+    cached = _RATE_CACHE.get(code)
+    if cached is not None and now - cached[0] < _CACHE_TTL:
+        return cached[1]
+
     if code in _ECB_COUNTRIES:
-        return _fetch_ecb(code)
+        rate = _fetch_ecb(code)
     elif code == "GB":
-        return _fetch_boe()
+        rate = _fetch_boe()
     elif code == "US":
-        return _fetch_fred()
+        rate = _fetch_fred()
     else:
         raise FetchError(
             f"No online data source configured for country '{code}'. "
             "Please update the rate manually."
         )
+    _RATE_CACHE[code] = (now, rate)
+    return rate
+
+
+def clear_rate_cache() -> None:
+    """Forget cached rates and HTTP validators, so the next fetch hits the network."""
+    _RATE_CACHE.clear()
+    _VALIDATORS.clear()
+
+
+def _remember_validators(key: str, resp: requests.Response, rate: Decimal) -> None:
+    headers = {}
+    if etag := resp.headers.get("ETag"):
+        headers["If-None-Match"] = etag
+    if last_modified := resp.headers.get("Last-Modified"):
+        headers["If-Modified-Since"] = last_modified
+    if headers:
+        _VALIDATORS[key] = (headers, rate)
 
 
 def _fetch_ecb(country_code: str) -> Decimal:
     url = _ECB_URL.format(cc=country_code)
+    cached = _VALIDATORS.get(country_code)
     try:
-        resp = requests.get(url, timeout=_TIMEOUT)
+        resp = _SESSION.get(
+            url,
+            headers=cached[0] if cached else None,
+            timeout=(_CONNECT_TIMEOUT, _TIMEOUT),
+        )
         resp.raise_for_status()
     except requests.RequestException as exc:
         raise FetchError(f"ECB API request failed: {exc}") from exc
+    if resp.status_code == 304 and cached is not None:
+        return cached[1]
 
     try:
-        data = resp.json()
+        # Decode straight from bytes and keep numbers as Decimal (no float round-trip)
+        data = json.loads(resp.content, parse_float=Decimal)
         # ECB JSON-stat-2 format: dataSets[0].series["0:0:0:0:0:0:0:0:0:0:0"].observations
         series = data["dataSets"][0]["series"]
-        # There should be exactly one series key
-        series_key = next(iter(series))
-        observations = series[series_key]["observations"]
+        # There should be exactly one series
+        observations = next(iter(series.values()))["observations"]
         # lastNObservations=1 → only one observation
-        obs_key = next(iter(observations))
-        value = observations[obs_key][0]  # annualised rate in percent
+        value = next(iter(observations.values()))[0]  # annualised rate in percent
         if value is None:
             raise FetchError(f"ECB returned null value for {country_code}.")
         # ECB returns percentage (e.g. 3.5), convert to fraction
         rate = Decimal(str(value)) / Decimal("100")
-        return rate
-    except (KeyError, IndexError, StopIteration, TypeError) as exc:
+    except (KeyError, IndexError, StopIteration, TypeError, ValueError) as exc:
         raise FetchError(f"Failed to parse ECB response for {country_code}: {exc}") from exc
+    _remember_validators(country_code, resp, rate)
+    return rate
 
 
 def _fetch_boe() -> Decimal:
@@ -101,26 +165,31 @@ def _fetch_boe() -> Decimal:
         "?csv.x=yes&Datefrom=01/Jan/2024&Dateto=now&SeriesCodes=IUMTLMV&CSVF=TT&UsingCodes=Y"
     )
     try:
-        resp = requests.get(url, timeout=_TIMEOUT)
+        resp = _SESSION.get(url, stream=True, timeout=(_CONNECT_TIMEOUT, _TIMEOUT))
         resp.raise_for_status()
     except requests.RequestException as exc:
         raise FetchError(f"Bank of England API request failed: {exc}") from exc
 
     try:
-        lines = resp.text.strip().splitlines()
-        # CSV: DATE,IUMTLMV — take last data row
+        if resp.encoding is None:
+            resp.encoding = "utf-8"  # iter_lines would yield bytes otherwise
+        # CSV: DATE,IUMTLMV — stream the rows, keeping only the last value seen
         last_value = None
-        for line in lines[1:]:  # skip header
-            parts = line.split(",")
-            if len(parts) >= 2 and parts[1].strip():
+        for line in resp.iter_lines(decode_unicode=True):
+            parts = line.split(",", 2)
+            if len(parts) >= 2 and parts[1].strip() and not line.startswith("DATE"):
                 last_value = parts[1].strip()
         if last_value is None:
             raise FetchError("No data returned from Bank of England.")
         # BoE returns percentage
         rate = Decimal(last_value) / Decimal("100")
         return rate
+    except requests.RequestException as exc:
+        raise FetchError(f"Bank of England API request failed: {exc}") from exc
     except (IndexError, ValueError) as exc:
         raise FetchError(f"Failed to parse Bank of England response: {exc}") from exc
+    finally:
+        resp.close()
 
 
 def _fetch_fred() -> Decimal:
@@ -138,14 +207,22 @@ def _fetch_fred() -> Decimal:
         "sort_order": "desc",
         "limit": 1,
     }
+    cached = _VALIDATORS.get("US")
     try:
-        resp = requests.get(_FRED_URL, params=params, timeout=_TIMEOUT)
+        resp = _SESSION.get(
+            _FRED_URL,
+            params=params,
+            headers=cached[0] if cached else None,
+            timeout=(_CONNECT_TIMEOUT, _TIMEOUT),
+        )
         resp.raise_for_status()
     except requests.RequestException as exc:
         raise FetchError(f"FRED API request failed: {exc}") from exc
+    if resp.status_code == 304 and cached is not None:
+        return cached[1]
 
     try:
-        data = resp.json()
+        data = json.loads(resp.content)
         observations = data["observations"]
         if not observations:
             raise FetchError("FRED returned no observations.")
@@ -153,6 +230,7 @@ def _fetch_fred() -> Decimal:
         if value_str == ".":
             raise FetchError("FRED returned missing value ('.').")
         rate = Decimal(value_str) / Decimal("100")
-        return rate
     except (KeyError, IndexError, ValueError) as exc:
         raise FetchError(f"Failed to parse FRED response: {exc}") from exc
+    _remember_validators("US", resp, rate)
+    return rate
@@ -10,19 +10,26 @@ Search space:
 """
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
 from dataclasses import dataclass
-from decimal import Decimal
-from typing import Optional
+from decimal import ROUND_CEILING, ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from itertools import pairwise
+from typing import Callable, Optional
 
 from .calculator import LoanPlan, compute_loan_plan
 from .config import (
-    STEP_DOWN_PAYMENT, VALID_PREFERENCES, ZERO,
+    QUANT_BPS, STEP_DOWN_PAYMENT, VALID_PREFERENCES, VALID_PREFERENCES_SORTED, ZERO,
     SWEET_SPOT_LTV_TARGET, SWEET_SPOT_RESERVE_MONTHS, SWEET_SPOT_OPPORTUNITY_COST_RATE,
 )
+from .profiles import LtvRateTier
 from .resolver import ResolvedParams
 
+_MARGINAL_STEP = Decimal("1000")  # marginal_saving_per_1k compares plans this far apart
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class OptimizedResult:
     down_payment: Decimal
     loan_principal: Decimal
@@ -38,54 +45,75 @@ class OptimizedResult:
     purchase_taxes: Decimal
     total_acquisition_cost: Decimal
     optimization_preference: str
-    parameters_source: dict[str, str]
+    parameters_source: Mapping[str, str]   # read-only, shared with ResolvedParams.sources
+
+
+# ── Scoring ───────────────────────────────────────────────────────────────────
+# One sort-key function per preference (lower is better), dispatched once per
+# optimize() call via _SCORERS rather than re-tested for every grid cell.
+
+def _score_total_cost(plan: LoanPlan, down_payment: Decimal, duration: int) -> tuple:
+    return (plan.total_cost_of_credit, plan.monthly_installment, down_payment)
+
+
+def _score_monthly_payment(plan: LoanPlan, down_payment: Decimal, duration: int) -> tuple:
+    return (plan.monthly_installment, plan.total_cost_of_credit, -down_payment)
+
 
+def _score_duration(plan: LoanPlan, down_payment: Decimal, duration: int) -> tuple:
+    return (duration, plan.total_cost_of_credit, plan.monthly_installment)
 
-def _score(
-    preference: str,
-    plan: LoanPlan,
-    down_payment: Decimal,
-    duration: int,
-) -> tuple:
-    """Return a sort key (lower is better) for the given plan."""
-    tc = plan.total_cost_of_credit
+
+def _score_down_payment(plan: LoanPlan, down_payment: Decimal, duration: int) -> tuple:
+    return (down_payment, plan.total_cost_of_credit, plan.monthly_installment)
+
+
+def _score_balanced(plan: LoanPlan, down_payment: Decimal, duration: int) -> tuple:
+    # Composite score: penalises both total cost and monthly burden.
+    # tc + mp * duration ≈ total_interest + total_repaid, so for a fixed
+    # duration this simply weights total cost twice vs a pure cost sort.
     mp = plan.monthly_installment
-    dp = down_payment
-
-    if preference == "minimize_total_cost":
-        return (tc, mp, dp)
-    elif preference == "minimize_monthly_payment":
-        return (mp, tc, -dp)
-    elif preference == "minimize_duration":
-        return (duration, tc, mp)
-    elif preference == "minimize_down_payment":
-        return (dp, tc, mp)
-    else:  # balanced
-        # Composite score: penalises both total cost and monthly burden.
-        # tc + mp * duration ≈ total_interest + total_repaid, so for a fixed
-        # duration this simply weights total cost twice vs a pure cost sort.
-        return (tc + mp * Decimal(duration), mp, dp)
-
-
-def _build_dp_candidates(params: ResolvedParams) -> list:
-    """Return the ordered list of down-payment amounts to evaluate.
-
-    Starts from min_down_payment (exact), then steps in STEP_DOWN_PAYMENT
-    increments up to available_savings (always included as the last entry).
+    return (plan.total_cost_of_credit + mp * duration, mp, down_payment)
+
+
+_SCORERS: dict[str, Callable[[LoanPlan, Decimal, int], tuple]] = {
+    "minimize_total_cost": _score_total_cost,
+    "minimize_monthly_payment": _score_monthly_payment,
+    "minimize_duration": _score_duration,
+    "minimize_down_payment": _score_down_payment,
+    "balanced": _score_balanced,
+}
+
+# Preferences whose primary key never improves as the down payment moves away
+# from one end of the grid (given rates that do not fall as LTV rises), so the
+# scan can start at that end and stop at the first strictly worse feasible plan.
+_BEST_AT_MAX_DP = frozenset({"minimize_total_cost", "minimize_monthly_payment", "balanced"})
+_BEST_AT_MIN_DP = frozenset({"minimize_down_payment"})
+
+
+def _rates_monotone(params: ResolvedParams) -> bool:
+    """True when rate_for_ltv is non-decreasing in LTV.
+
+    Tiers are validated ascending in ResolvedParams, so only the deltas need checking.
     """
-    dp = params.min_down_payment
-    if dp % STEP_DOWN_PAYMENT != ZERO:
-        dp_aligned = (dp // STEP_DOWN_PAYMENT + 1) * STEP_DOWN_PAYMENT
-        candidates: list = [params.min_down_payment]
-        dp = dp_aligned
-    else:
-        candidates = []
-    while dp <= params.available_savings:
-        candidates.append(dp)
-        dp += STEP_DOWN_PAYMENT
-    if not candidates or candidates[-1] < params.available_savings:
-        candidates.append(params.available_savings)
-    return candidates
+    return all(a.rate_delta <= b.rate_delta for a, b in pairwise(params.ltv_rate_tiers))
+
+
+@lru_cache(maxsize=16)
+def _dp_grid(min_dp: Decimal, savings: Decimal) -> tuple[Decimal, ...]:
+    """Return the ordered down-payment amounts to evaluate.
+
+    Starts from min_dp (exact), then steps in STEP_DOWN_PAYMENT increments up
+    to savings (always included as the last entry).  Memoised: optimize() and
+    analyze_sweet_spot() share the same grid for a given simulation.
+    """
+    step = int(STEP_DOWN_PAYMENT)
+    first = int((min_dp / STEP_DOWN_PAYMENT).to_integral_value(rounding=ROUND_CEILING)) * step
+    candidates: list = [] if first == min_dp else [min_dp]
+    candidates.extend(map(Decimal, range(first, int(savings) + 1, step)))
+    if not candidates or candidates[-1] < savings:
+        candidates.append(savings)
+    return tuple(candidates)
 
 
 def optimize(params: ResolvedParams) -> OptimizedResult:
@@ -97,14 +125,11 @@ def optimize(params: ResolvedParams) -> OptimizedResult:
     if preference not in VALID_PREFERENCES:
         raise ValueError(
             f"Unknown optimization preference '{preference}'. "
-            f"Valid values: {', '.join(sorted(VALID_PREFERENCES))}"
+            f"Valid values: {', '.join(VALID_PREFERENCES_SORTED)}"
         )
+    scorer = _SCORERS[preference]
 
-    # Effective monthly cap = stricter of DTI limit and absolute payment cap (§4.2).
-    effective_cap = min(
-        params.monthly_net_income * params.max_debt_ratio,
-        params.max_monthly_payment,
-    )
+    effective_cap = params.effective_monthly_cap
 
     best_plan: Optional[LoanPlan] = None
     best_down_payment = ZERO
@@ -113,38 +138,63 @@ def optimize(params: ResolvedParams) -> OptimizedResult:
 
     # If the user pinned a down payment, evaluate only that; otherwise grid-search.
     if params.preferred_down_payment is not None:
-        candidates_dp = [params.preferred_down_payment]
+        candidates_dp: tuple[Decimal, ...] = (params.preferred_down_payment,)
     else:
-        candidates_dp = _build_dp_candidates(params)
+        candidates_dp = _dp_grid(params.min_down_payment, params.available_savings)
+
+    # Both principal and rate shrink as the down payment grows, so cost and
+    # installment fall monotonically along the grid and feasibility only improves.
+    # Scan from the preference's best end and stop once the primary key worsens.
+    prune = (preference in _BEST_AT_MAX_DP or preference in _BEST_AT_MIN_DP) and _rates_monotone(params)
+    if prune and preference in _BEST_AT_MAX_DP:
+        candidates_dp = candidates_dp[::-1]
+
+    # Loop invariants bound to locals once.
+    tac = params.total_acquisition_cost
+    price = params.property_price
+    ins = params.insurance_rate
+    rate_for_ltv = params.rate_for_ltv
+    durations = (params.fixed_loan_duration_months,)
+
+    if prune and preference in _BEST_AT_MIN_DP:
+        # Feasibility only improves as the down payment grows, so the ascending
+        # scan can start at the first candidate within the cap (found by bisection;
+        # the probed plans are cached and reused by the loop below).
+        def _within_cap(dp: Decimal) -> bool:
+            principal = tac - dp
+            if principal <= ZERO:
+                return True
+            plan = compute_loan_plan(principal, rate_for_ltv(principal / price), ins, durations[0])
+            return plan.monthly_installment <= effective_cap
+
+        candidates_dp = candidates_dp[bisect_left(candidates_dp, True, key=_within_cap):]
 
     for down_payment in candidates_dp:
-        principal = params.total_acquisition_cost - down_payment
+        principal = tac - down_payment
         if principal <= ZERO:
             # Buyer pays cash — trivially feasible but unusual; skip (loan = 0)
             continue
 
-        ltv = principal / params.property_price
-        effective_rate = params.rate_for_ltv(ltv)
+        effective_rate = rate_for_ltv(principal / price)
 
-        duration_candidates = [params.fixed_loan_duration_months]
-        for duration in duration_candidates:
-            plan = compute_loan_plan(
-                principal,
-                effective_rate,
-                params.insurance_rate,
-                duration,
-            )
+        for duration in durations:
+            plan = compute_loan_plan(principal, effective_rate, ins, duration)
 
             # Constraint checks
             if plan.monthly_installment > effective_cap:
                 continue
 
-            score = _score(preference, plan, down_payment, duration)
+            score = scorer(plan, down_payment, duration)
             if best_score is None or score < best_score:
                 best_score = score
                 best_plan = plan
                 best_down_payment = down_payment
                 best_duration = duration
+            elif prune and score[0] > best_score[0]:
+                break
+        else:
+            continue
+        break  # pruned: every remaining candidate is dominated
 
     if best_plan is None:
         raise ValueError(
@@ -154,7 +204,7 @@ def optimize(params: ResolvedParams) -> OptimizedResult:
 
     principal = params.total_acquisition_cost - best_down_payment
     ltv_ratio = (principal / params.property_price).quantize(
-        Decimal("0.0001"), rounding="ROUND_HALF_UP"
+        QUANT_BPS, rounding=ROUND_HALF_UP
     )
 
     return OptimizedResult(
@@ -171,13 +221,13 @@ def optimize(params: ResolvedParams) -> OptimizedResult:
         purchase_taxes=params.purchase_taxes,
         total_acquisition_cost=params.total_acquisition_cost,
         optimization_preference=preference,
-        parameters_source=dict(params.sources),
+        parameters_source=params.sources,
     )
 
 
 # ── Sweet-spot analysis ────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SweetSpotMilestone:
     """One row in the sweet-spot comparison table."""
     label: str
@@ -193,7 +243,7 @@ class SweetSpotMilestone:
 
 @dataclass(frozen=True)
 class SweetSpotAnalysis:
-    milestones: list              # list[SweetSpotMilestone], ordered by down_payment
+    milestones: tuple             # tuple[SweetSpotMilestone, ...], ordered by down_payment
     sweet_spot_reason: str        # human-readable explanation
     reserve_warning: str          # non-empty when min down payment already exceeds reserve
     duration_months: int
@@ -204,6 +254,16 @@ class SweetSpotAnalysis:
     down_payment_is_efficient: bool   # True when mortgage yield > opportunity cost
 
 
+@lru_cache(maxsize=32)
+def _tier_index(tiers: tuple) -> tuple[tuple, Optional[LtvRateTier]]:
+    """Return (ltv_max keys of the ascending tiers, nearest non-surcharge tier).
+
+    The nearest non-surcharge tier is the highest-LTV tier with rate_delta ≤ 0,
+    or None when every tier carries a surcharge.
+    """
+    nearest = next((t for t in reversed(tiers) if t.rate_delta <= ZERO), None)
+    return tuple(t.ltv_max for t in tiers), nearest
+
 
 def analyze_sweet_spot(
     params: ResolvedParams,
@@ -237,17 +297,17 @@ def analyze_sweet_spot(
     opp_rate = opportunity_cost_rate if opportunity_cost_rate is not None else SWEET_SPOT_OPPORTUNITY_COST_RATE
 
     duration = params.fixed_loan_duration_months
-    candidates = _build_dp_candidates(params)
+    candidates = _dp_grid(params.min_down_payment, params.available_savings)
 
     def _milestone(dp: Decimal, label: str, is_sweet: bool = False) -> SweetSpotMilestone:
         principal = params.total_acquisition_cost - dp
         ltv = (principal / params.property_price).quantize(
-            Decimal("0.0001"), rounding="ROUND_HALF_UP"
+            QUANT_BPS, rounding=ROUND_HALF_UP
         )
         eff_rate = params.rate_for_ltv(ltv)
         plan = compute_loan_plan(principal, eff_rate, params.insurance_rate, duration)
         dti = (plan.monthly_installment / params.monthly_net_income).quantize(
-            Decimal("0.0001"), rounding="ROUND_HALF_UP"
+            QUANT_BPS, rounding=ROUND_HALF_UP
         )
         return SweetSpotMilestone(
             label=label,
@@ -270,23 +330,19 @@ def analyze_sweet_spot(
     min_dp = candidates[0]
     _min_principal = params.total_acquisition_cost - min_dp
     _min_ltv = _min_principal / params.property_price
-    _min_rate_delta = ZERO
-    for _t in sorted(params.ltv_rate_tiers, key=lambda t: t.ltv_max):
-        if _min_ltv <= _t.ltv_max:
-            _min_rate_delta = _t.rate_delta
-            break
+    _tiers = params.ltv_rate_tiers
+    _ltv_maxes, _nearest = _tier_index(_tiers)
+    _i = bisect_left(_ltv_maxes, _min_ltv)
+    _min_rate_delta = _tiers[_i].rate_delta if _i < len(_tiers) else ZERO
     effective_floor_dp = min_dp
-    if _min_rate_delta > ZERO:
-        # Find highest-LTV non-surcharge tier (cheapest to reach from above).
-        _non_surcharge = [t for t in params.ltv_rate_tiers if t.rate_delta <= ZERO]
-        if _non_surcharge:
-            _nearest = max(_non_surcharge, key=lambda t: t.ltv_max)
-            _exact = params.total_acquisition_cost - params.property_price * _nearest.ltv_max
-            _floor_cand = (
-                _exact / STEP_DOWN_PAYMENT
-            ).to_integral_value(rounding="ROUND_CEILING") * STEP_DOWN_PAYMENT
-            if _floor_cand <= params.available_savings:
-                effective_floor_dp = _floor_cand
+    if _min_rate_delta > ZERO and _nearest is not None:
+        # _nearest: highest-LTV non-surcharge tier (cheapest to reach from above).
+        _exact = params.total_acquisition_cost - params.property_price * _nearest.ltv_max
+        _floor_cand = (
+            _exact / STEP_DOWN_PAYMENT
+        ).to_integral_value(rounding=ROUND_CEILING) * STEP_DOWN_PAYMENT
+        if _floor_cand <= params.available_savings:
+            effective_floor_dp = _floor_cand
 
     # --- Marginal economics (computed at the effective floor) ---
     # Uses LTV-adjusted rates: the marginal saving is constant within a tier
@@ -295,7 +351,7 @@ def analyze_sweet_spot(
     ref_ltv = ref_principal / params.property_price
     ref_rate = params.rate_for_ltv(ref_ltv)
     plan_ref = compute_loan_plan(ref_principal, ref_rate, params.insurance_rate, duration)
-    alt_principal = ref_principal - Decimal("1000")
+    alt_principal = ref_principal - _MARGINAL_STEP
     alt_ltv = alt_principal / params.property_price
     alt_rate = params.rate_for_ltv(alt_ltv)
     plan_ref_minus1k = compute_loan_plan(alt_principal, alt_rate, params.insurance_rate, duration)
@@ -310,11 +366,9 @@ def analyze_sweet_spot(
     # --- 6-month reserve ceiling ---
     reserve_target = SWEET_SPOT_RESERVE_MONTHS * params.monthly_net_income
     reserve_ceiling_exact = params.available_savings - reserve_target
-    reserve_dp: Decimal = candidates[0]
-    for c in reversed(candidates):
-        if c <= reserve_ceiling_exact:
-            reserve_dp = c
-            break
+    # candidates is ascending: the last one within the ceiling is found by bisection.
+    reserve_idx = bisect_right(candidates, reserve_ceiling_exact) - 1
+    reserve_dp: Decimal = candidates[max(reserve_idx, 0)]
 
     # --- Sweet spot selection ---
     ltv_pct = int(SWEET_SPOT_LTV_TARGET * 100)
@@ -360,12 +414,11 @@ def analyze_sweet_spot(
         )
 
     # --- LTV 80 % reference milestone ---
-    ltv_dp: Optional[Decimal] = None
-    for c in candidates:
-        principal = params.total_acquisition_cost - c
-        if principal / params.property_price <= SWEET_SPOT_LTV_TARGET:
-            ltv_dp = c
-            break
+    # LTV is monotone decreasing in down payment: (tac - c) / price <= target
+    # ⇔ c >= tac - price × target, so bisect for the first such candidate.
+    ltv_threshold = params.total_acquisition_cost - params.property_price * SWEET_SPOT_LTV_TARGET
+    ltv_idx = bisect_left(candidates, ltv_threshold)
+    ltv_dp: Optional[Decimal] = candidates[ltv_idx] if ltv_idx < len(candidates) else None
 
     # --- Build deduplicated, ordered milestone list ---
     spec: dict = {}   # Decimal -> (label, is_sweet)
@@ -389,7 +442,7 @@ def analyze_sweet_spot(
             continue  # crossing this threshold does not improve the rate
         exact_dp = params.total_acquisition_cost - params.property_price * tier.ltv_max
         tier_dp = (exact_dp / STEP_DOWN_PAYMENT).to_integral_value(
-            rounding="ROUND_CEILING"
+            rounding=ROUND_CEILING
         ) * STEP_DOWN_PAYMENT
         if params.min_down_payment < tier_dp < params.available_savings:
             _add(tier_dp, f"LTV≤{int(tier.ltv_max * 100)}% rate↓")
@@ -410,10 +463,10 @@ def analyze_sweet_spot(
         else:
             spec[pref] = ("Your choice", False)
 
-    milestones = [
+    milestones = tuple(
         _milestone(dp, label, is_sweet)
         for dp, (label, is_sweet) in sorted(spec.items())
-    ]
+    )
 
     return SweetSpotAnalysis(
         milestones=milestones,
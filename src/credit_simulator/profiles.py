@@ -12,13 +12,16 @@ whose ltv_max >= the loan's LTV applies.
 """
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from decimal import Decimal
+from itertools import pairwise
+from typing import Callable
 
-from .config import DEFAULT_COUNTRY, DEFAULT_QUALITY, ProfileQuality
+from .config import DEFAULT_COUNTRY, DEFAULT_QUALITY, ProfileQuality, ZERO
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LtvRateTier:
     """One LTV band and its rate adjustment (delta added to the base rate).
 
@@ -30,7 +33,32 @@ class LtvRateTier:
     rate_delta: Decimal # e.g. Decimal("-0.0015") = -0.15 percentage points
 
 
-@dataclass(frozen=True)
+def ltv_tier_keys(tiers: tuple[LtvRateTier, ...]) -> tuple[tuple[Decimal, ...], tuple[Decimal, ...]]:
+    """Split tiers into parallel (ltv_max, rate_delta) tuples for ltv_rate_delta.
+
+    Raises ValueError unless ltv_max is strictly ascending.
+    """
+    ltv_maxes = tuple(t.ltv_max for t in tiers)
+    if any(a >= b for a, b in pairwise(ltv_maxes)):
+        raise ValueError(
+            "LTV tiers must be in strictly ascending ltv_max order, got "
+            + ", ".join(str(m) for m in ltv_maxes)
+        )
+    return ltv_maxes, tuple(t.rate_delta for t in tiers)
+
+
+def ltv_rate_delta(ltv_maxes: tuple[Decimal, ...], rate_deltas: tuple[Decimal, ...], ltv: Decimal) -> Decimal:
+    """Rate delta of the first tier with ltv <= ltv_max.
+
+    Above the last tier the last delta still applies; with no tiers the delta is zero.
+    """
+    if not rate_deltas:
+        return ZERO
+    i = bisect_left(ltv_maxes, ltv)
+    return rate_deltas[i] if i < len(rate_deltas) else rate_deltas[-1]
+
+
+@dataclass(frozen=True, slots=True)
 class CountryProfile:
     code: str
     currency: str
@@ -47,6 +75,14 @@ class CountryProfile:
     max_loan_duration_months: int
     # LTV-based rate adjustment tiers (ascending ltv_max order)
     ltv_rate_tiers: tuple[LtvRateTier, ...] = ()
+    # Parallel (ltv_max, rate_delta) keys for rate_for_ltv, derived from ltv_rate_tiers
+    _ltv_maxes: tuple = field(init=False, repr=False, compare=False)
+    _rate_deltas: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        ltv_maxes, rate_deltas = ltv_tier_keys(self.ltv_rate_tiers)
+        object.__setattr__(self, "_ltv_maxes", ltv_maxes)
+        object.__setattr__(self, "_rate_deltas", rate_deltas)
 
     def annual_rate(self, quality: ProfileQuality) -> Decimal:
         return self.annual_rate_average if quality == "average" else self.annual_rate_best
@@ -56,13 +92,11 @@ class CountryProfile:
 
     def rate_for_ltv(self, ltv: Decimal, quality: ProfileQuality) -> Decimal:
         """Effective annual rate after applying the matching LTV tier delta."""
-        base = self.annual_rate(quality)
-        for tier in self.ltv_rate_tiers:
-            if ltv <= tier.ltv_max:
-                return base + tier.rate_delta
-        if self.ltv_rate_tiers:
-            return base + self.ltv_rate_tiers[-1].rate_delta
-        return base
+        return self.annual_rate(quality) + self.ltv_rate_delta(ltv)
+
+    def ltv_rate_delta(self, ltv: Decimal) -> Decimal:
+        """Delta of the LTV tier that prices ``ltv`` (zero without tiers)."""
+        return ltv_rate_delta(self._ltv_maxes, self._rate_deltas, ltv)
 
 
 # ── LTV tier helpers ──────────────────────────────────────────────────────────
@@ -255,6 +289,13 @@ _PROFILES: dict[str, CountryProfile] = {
 }
 
 SUPPORTED_COUNTRIES = frozenset(_PROFILES.keys())
+_SUPPORTED_CODES_MSG = ", ".join(sorted(SUPPORTED_COUNTRIES))
+
+# Override keys for the quality-sensitive fields, built once instead of per call.
+_ANNUAL_KEY: dict[str, str] = {"average": "annual_rate_average", "best": "annual_rate_best"}
+_INSURANCE_KEY: dict[str, str] = {"average": "insurance_rate_average", "best": "insurance_rate_best"}
+
+_MISSING = object()  # sentinel: no session override for this (country, field)
 
 
 def get_profile(country: str) -> CountryProfile:
@@ -263,69 +304,66 @@ def get_profile(country: str) -> CountryProfile:
     Raises ValueError for unknown country codes.
     """
     code = country.upper()
-    if code not in _PROFILES:
+    try:
+        return _PROFILES[code]
+    except KeyError:
         raise ValueError(
             f"Unsupported country code '{code}'. "
-            f"Supported codes: {', '.join(sorted(SUPPORTED_COUNTRIES))}"
-        )
-    return _PROFILES[code]
+            f"Supported codes: {_SUPPORTED_CODES_MSG}"
+        ) from None
+
+
+def _profile_for_code(code: str) -> CountryProfile:
+    """get_profile() for a code that is already upper-cased."""
+    try:
+        return _PROFILES[code]
+    except KeyError:
+        return get_profile(code)  # raises the ValueError
 
 
 class SessionProfileStore:
     """Mutable, session-scoped overlay on top of the static profiles.
 
-    Modifications are stored in a per-country dict keyed by field name.
+    Modifications are stored in one dict keyed by (country_code, field name).
     The static profile is read-through for any field not overridden.
+    ``version`` is incremented on every modification so callers can tell
+    whether the store changed between two reads.
     """
 
     def __init__(self) -> None:
-        # Overrides stored as {country_code: {field: value}}
-        self._overrides: dict[str, dict[str, object]] = {}
+        self.version = 0
+        # Overrides stored as {(country_code, field): value}
+        self._overrides: dict[tuple[str, str], object] = {}
         # Track which annual_rate values were manually set by the user
         # (to decide whether online fetch should prompt for confirmation)
         self._manual_rate_set: set[tuple[str, ProfileQuality]] = set()
 
     def get_rate_for_ltv(self, country: str, quality: ProfileQuality, ltv: Decimal) -> Decimal:
         """Base rate (with any session override applied) plus the LTV tier delta."""
-        base = self.get_annual_rate(country, quality)
-        profile = get_profile(country.upper())
-        for tier in profile.ltv_rate_tiers:
-            if ltv <= tier.ltv_max:
-                return base + tier.rate_delta
-        if profile.ltv_rate_tiers:
-            return base + profile.ltv_rate_tiers[-1].rate_delta
-        return base
+        code = country.upper()
+        return self._annual_rate(code, quality) + _profile_for_code(code).ltv_rate_delta(ltv)
 
     def get_annual_rate(self, country: str, quality: ProfileQuality) -> Decimal:
-        code = country.upper()
-        key = f"annual_rate_{quality}"
-        overrides = self._overrides.get(code, {})
-        if key in overrides:
-            return overrides[key]  # type: ignore[return-value]
-        return get_profile(code).annual_rate(quality)
+        return self._annual_rate(country.upper(), quality)
 
     def get_insurance_rate(self, country: str, quality: ProfileQuality) -> Decimal:
-        code = country.upper()
-        key = f"insurance_rate_{quality}"
-        overrides = self._overrides.get(code, {})
-        if key in overrides:
-            return overrides[key]  # type: ignore[return-value]
-        return get_profile(code).insurance_rate(quality)
+        return self._insurance_rate(country.upper(), quality)
 
     def get_field(self, country: str, field: str) -> object:
         """Get a non-quality-sensitive field, respecting any session override."""
         code = country.upper()
-        overrides = self._overrides.get(code, {})
-        if field in overrides:
-            return overrides[field]
-        return getattr(get_profile(code), field)
+        value = self._overrides.get((code, field), _MISSING)
+        if value is not _MISSING:
+            return value
+        return getattr(_profile_for_code(code), field)
 
     def set_annual_rate(
         self, country: str, quality: ProfileQuality, value: Decimal, *, manual: bool
     ) -> None:
         code = country.upper()
         self._validate_rate_invariant(code, quality, value)
-        self._overrides.setdefault(code, {})[f"annual_rate_{quality}"] = value
+        self._overrides[(code, _ANNUAL_KEY[quality])] = value
+        self.version += 1
         if manual:
             self._manual_rate_set.add((code, quality))
 
@@ -334,48 +372,82 @@ class SessionProfileStore:
     ) -> None:
         code = country.upper()
         self._validate_insurance_invariant(code, quality, value)
-        self._overrides.setdefault(code, {})[f"insurance_rate_{quality}"] = value
+        self._overrides[(code, _INSURANCE_KEY[quality])] = value
+        self.version += 1
 
     def set_field(self, country: str, field: str, value: object) -> None:
+        """Override a non-quality-sensitive field.
+
+        Raises ValueError for an unknown field or a value whose type differs
+        from the profile's (e.g. a float for a Decimal ratio), so overrides
+        can be read back without conversion.
+        """
         code = country.upper()
-        self._overrides.setdefault(code, {})[field] = value
+        current = getattr(_profile_for_code(code), field, _MISSING)
+        if current is _MISSING:
+            raise ValueError(f"Unknown profile field '{field}'.")
+        if type(value) is not type(current):
+            raise ValueError(
+                f"{field} must be {type(current).__name__}, "
+                f"got {type(value).__name__} ({value!r})."
+            )
+        self._overrides[(code, field)] = value
+        self.version += 1
 
     def is_annual_rate_manually_set(self, country: str, quality: ProfileQuality) -> bool:
         return (country.upper(), quality) in self._manual_rate_set
 
+    # Internal accessors: *code* is already upper-cased by the public methods.
+
+    def _annual_rate(self, code: str, quality: ProfileQuality) -> Decimal:
+        value = self._overrides.get((code, _ANNUAL_KEY[quality]), _MISSING)
+        if value is not _MISSING:
+            return value  # type: ignore[return-value]
+        return _profile_for_code(code).annual_rate(quality)
+
+    def _insurance_rate(self, code: str, quality: ProfileQuality) -> Decimal:
+        value = self._overrides.get((code, _INSURANCE_KEY[quality]), _MISSING)
+        if value is not _MISSING:
+            return value  # type: ignore[return-value]
+        return _profile_for_code(code).insurance_rate(quality)
+
     def _validate_rate_invariant(
         self, code: str, quality: ProfileQuality, value: Decimal
     ) -> None:
         """Ensure best <= average after the proposed update."""
-        if quality == "best":
-            avg = self.get_annual_rate(code, "average")
-            if value > avg:
-                raise ValueError(
-                    f"'best' annual rate ({value:%}) cannot exceed "
-                    f"'average' rate ({avg:%}) for {code}."
-                )
-        else:  # quality == "average"
-            best = self.get_annual_rate(code, "best")
-            if value < best:
-                raise ValueError(
-                    f"'average' annual rate ({value:%}) cannot be lower than "
-                    f"'best' rate ({best:%}) for {code}."
-                )
+        self._validate_invariant("annual", self._annual_rate, code, quality, value)
 
     def _validate_insurance_invariant(
         self, code: str, quality: ProfileQuality, value: Decimal
     ) -> None:
+        self._validate_invariant("insurance", self._insurance_rate, code, quality, value)
+
+    @staticmethod
+    def _validate_invariant(
+        kind: str,
+        getter: Callable[[str, ProfileQuality], Decimal],
+        code: str,
+        quality: ProfileQuality,
+        value: Decimal,
+    ) -> None:
+        """Ensure best <= average for the *kind* rate read through *getter*.
+
+        Re-submitting the current value cannot break the invariant, so it
+        returns without reading the other quality.
+        """
+        if value == getter(code, quality):
+            return
         if quality == "best":
-            avg = self.get_insurance_rate(code, "average")
+            avg = getter(code, "average")
             if value > avg:
                 raise ValueError(
-                    f"'best' insurance rate ({value:%}) cannot exceed "
+                    f"'best' {kind} rate ({value:%}) cannot exceed "
                     f"'average' rate ({avg:%}) for {code}."
                 )
-        else:
-            best = self.get_insurance_rate(code, "best")
+        else:  # quality == "average"
+            best = getter(code, "best")
             if value < best:
                 raise ValueError(
-                    f"'average' insurance rate ({value:%}) cannot be lower than "
+                    f"'average' {kind} rate ({value:%}) cannot be lower than "
                     f"'best' rate ({best:%}) for {code}."
                 )
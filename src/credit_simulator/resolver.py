@@ -10,15 +10,17 @@ Resolution order:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from decimal import Decimal
+from collections.abc import Mapping
+from decimal import ROUND_HALF_UP, Decimal
+from types import MappingProxyType
 from typing import Optional
 
 from .calculator import compute_emi, compute_monthly_insurance
-from .config import DEFAULT_COUNTRY, DEFAULT_QUALITY, DEFAULT_LOAN_DURATION_MONTHS, DEFAULT_MAX_MONTHLY_PAYMENT, ProfileQuality, ZERO
-from .profiles import LtvRateTier, SessionProfileStore, get_profile
+from .config import CENT, DEFAULT_COUNTRY, DEFAULT_QUALITY, DEFAULT_LOAN_DURATION_MONTHS, DEFAULT_MAX_MONTHLY_PAYMENT, VALID_QUALITIES, ProfileQuality, ZERO
+from .profiles import LtvRateTier, SessionProfileStore, get_profile, ltv_rate_delta, ltv_tier_keys
 
 
-@dataclass
+@dataclass(slots=True)
 class UserInputs:
     """Raw user-supplied values.  None means 'not provided — use profile default'."""
     # Mandatory
@@ -43,7 +45,7 @@ class UserInputs:
     optimization_preference: str = "balanced"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolvedParams:
     """Fully resolved simulation parameters, ready for optimization."""
     # Country / quality
@@ -68,21 +70,34 @@ class ResolvedParams:
     max_debt_ratio: Decimal
     max_monthly_payment: Decimal
     min_down_payment: Decimal
-    # LTV-based rate tiers (from static profile, ordered ascending ltv_max)
+    # LTV-based rate tiers (from static profile, strictly ascending ltv_max — checked)
     ltv_rate_tiers: tuple  # tuple[LtvRateTier, ...]
     # Preference
     optimization_preference: str
-    # Provenance — 'user' or 'profile' for each optional param
-    sources: dict[str, str] = field(default_factory=dict)
+    # Provenance — 'user' or 'profile' for each optional param (read-only view)
+    sources: Mapping[str, str] = field(default_factory=dict)
+    # Derived: stricter of DTI limit and absolute payment cap (§4.2)
+    effective_monthly_cap: Decimal = field(init=False, compare=False)
+    # Parallel (ltv_max, rate_delta) keys for rate_for_ltv, derived from ltv_rate_tiers
+    _ltv_maxes: tuple = field(init=False, repr=False, compare=False)
+    _rate_deltas: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Instances are shared through the CLI's memoised _simulate, so the
+        # provenance map is frozen along with everything else.
+        object.__setattr__(self, "sources", MappingProxyType(dict(self.sources)))
+        object.__setattr__(
+            self,
+            "effective_monthly_cap",
+            min(self.monthly_net_income * self.max_debt_ratio, self.max_monthly_payment),
+        )
+        ltv_maxes, rate_deltas = ltv_tier_keys(self.ltv_rate_tiers)
+        object.__setattr__(self, "_ltv_maxes", ltv_maxes)
+        object.__setattr__(self, "_rate_deltas", rate_deltas)
 
     def rate_for_ltv(self, ltv: Decimal) -> Decimal:
         """Effective annual rate for the given LTV (base rate + tier delta)."""
-        for tier in self.ltv_rate_tiers:
-            if ltv <= tier.ltv_max:
-                return self.annual_interest_rate + tier.rate_delta
-        if self.ltv_rate_tiers:
-            return self.annual_interest_rate + self.ltv_rate_tiers[-1].rate_delta
-        return self.annual_interest_rate
+        return self.annual_interest_rate + ltv_rate_delta(self._ltv_maxes, self._rate_deltas, ltv)
 
 
 class InfeasibleError(Exception):
@@ -96,10 +111,15 @@ def resolve(inputs: UserInputs, store: SessionProfileStore) -> ResolvedParams:
     # --- Step 1: country & quality ---
     country = (inputs.country or DEFAULT_COUNTRY).upper()
     quality: ProfileQuality = inputs.profile_quality or DEFAULT_QUALITY
+    if quality not in VALID_QUALITIES:
+        raise ValueError(
+            f"Unknown profile quality '{quality}'. "
+            f"Valid values: {', '.join(VALID_QUALITIES)}"
+        )
     # Validate country code (will raise ValueError if unknown)
     profile = get_profile(country)
 
-    currency = str(store.get_field(country, "currency"))
+    currency = store.get_field(country, "currency")
     ltv_rate_tiers = profile.ltv_rate_tiers
 
     # --- Step 2: optional loan parameters ---
@@ -122,17 +142,17 @@ def resolve(inputs: UserInputs, store: SessionProfileStore) -> ResolvedParams:
     )
     min_down_payment_ratio = _resolve(
         inputs.min_down_payment_ratio,
-        Decimal(str(store.get_field(country, "min_down_payment_ratio"))),
+        store.get_field(country, "min_down_payment_ratio"),
         "min_down_payment_ratio",
     )
     max_loan_duration_months = _resolve(
         inputs.max_loan_duration_months,
-        int(store.get_field(country, "max_loan_duration_months")),
+        store.get_field(country, "max_loan_duration_months"),
         "max_loan_duration_months",
     )
     max_debt_ratio = _resolve(
         inputs.max_debt_ratio,
-        Decimal(str(store.get_field(country, "max_debt_ratio"))),
+        store.get_field(country, "max_debt_ratio"),
         "max_debt_ratio",
     )
     max_monthly_payment = _resolve(
@@ -154,15 +174,13 @@ def resolve(inputs: UserInputs, store: SessionProfileStore) -> ResolvedParams:
         sources["preferred_down_payment"] = "user"
 
     # --- Step 5: purchase_taxes ---
-    taxes_financeable = bool(store.get_field(country, "taxes_financeable"))
+    taxes_financeable = store.get_field(country, "taxes_financeable")
     if inputs.purchase_taxes is not None:
         purchase_taxes = inputs.purchase_taxes
         sources["purchase_taxes"] = "user"
     else:
-        tax_rate = Decimal(str(store.get_field(country, "purchase_tax_rate")))
-        purchase_taxes = (inputs.property_price * tax_rate).quantize(
-            Decimal("0.01"), rounding="ROUND_HALF_UP"
-        )
+        tax_rate = store.get_field(country, "purchase_tax_rate")
+        purchase_taxes = (inputs.property_price * tax_rate).quantize(CENT, rounding=ROUND_HALF_UP)
         sources["purchase_taxes"] = "profile"
 
     # --- Step 6: total acquisition cost ---
@@ -236,11 +254,7 @@ def check_feasibility(params: ResolvedParams) -> None:
         # Buyer can pay cash — loan is trivially feasible (loan = 0)
         return
 
-    # Effective monthly cap = stricter of DTI limit and absolute payment cap.
-    effective_cap = min(
-        params.monthly_net_income * params.max_debt_ratio,
-        params.max_monthly_payment,
-    )
+    effective_cap = params.effective_monthly_cap
 
     min_ltv = min_principal / params.property_price
     best_emi = compute_emi(
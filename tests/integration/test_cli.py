@@ -4,7 +4,7 @@ from decimal import Decimal
 import pytest
 from click.testing import CliRunner
 
-from credit_simulator.cli import main
+from credit_simulator.cli import main, run_simulation
 from credit_simulator.optimizer import optimize
 from credit_simulator.profiles import SessionProfileStore
 from credit_simulator.resolver import UserInputs, resolve
@@ -28,26 +28,28 @@ def _run_pipeline(preference: str = "balanced", **overrides):
     return optimize(params)
 
 
+@pytest.fixture(scope="module")
+def be_result():
+    # OptimizedResult is frozen, so one pipeline run can be shared across tests.
+    return _run_pipeline("minimize_total_cost")
+
+
 class TestBelgiumDefaultPipeline:
     """§7.1 Belgium example — all parameters auto-resolved."""
 
-    def test_result_country_is_be(self):
-        result = _run_pipeline("minimize_total_cost")
-        assert result.country == "BE"
+    def test_result_country_is_be(self, be_result):
+        assert be_result.country == "BE"
 
-    def test_total_acquisition_cost(self):
-        result = _run_pipeline("minimize_total_cost")
+    def test_total_acquisition_cost(self, be_result):
         # 350000 + 350000*12.5% = 350000 + 43750 = 393750
-        assert result.total_acquisition_cost == Decimal("393750")
+        assert be_result.total_acquisition_cost == Decimal("393750")
 
-    def test_monthly_installment_within_cap(self):
-        result = _run_pipeline("minimize_total_cost")
+    def test_monthly_installment_within_cap(self, be_result):
         # max_monthly_payment cap = 2200
-        assert result.plan.monthly_installment <= Decimal("2200.01")  # tolerance for rounding
+        assert be_result.plan.monthly_installment <= Decimal("2200.01")  # tolerance for rounding
 
-    def test_down_payment_within_savings(self):
-        result = _run_pipeline("minimize_total_cost")
-        assert result.down_payment <= Decimal("80000")
+    def test_down_payment_within_savings(self, be_result):
+        assert be_result.down_payment <= Decimal("80000")
 
 
 class TestAllPreferences:
@@ -78,6 +80,44 @@ class TestSessionProfileStoreOverride:
         params = resolve(inputs, store)
         assert params.annual_interest_rate == Decimal("0.04")
 
+    def test_version_bumped_on_every_modification(self):
+        store = SessionProfileStore()
+        assert store.version == 0
+        store.set_annual_rate("BE", "average", Decimal("0.04"), manual=True)
+        store.set_insurance_rate("BE", "average", Decimal("0.003"))
+        store.set_field("BE", "max_debt_ratio", Decimal("0.30"))
+        assert store.version == 3
+
+    def test_field_override_is_resolved(self):
+        store = SessionProfileStore()
+        store.set_field("BE", "max_debt_ratio", Decimal("0.30"))
+        store.set_field("be", "max_loan_duration_months", 300)
+        inputs = UserInputs(
+            property_price=Decimal("350000"),
+            monthly_net_income=Decimal("6000"),
+            available_savings=Decimal("80000"),
+        )
+        params = resolve(inputs, store)
+        assert params.max_debt_ratio == Decimal("0.30")
+        assert params.max_loan_duration_months == 300
+
+    @pytest.mark.parametrize("field,value", [
+        ("max_debt_ratio", 0.30),
+        ("purchase_tax_rate", "0.10"),
+        ("max_loan_duration_months", Decimal("300")),
+        ("max_loan_duration_months", True),
+        ("taxes_financeable", 1),
+    ])
+    def test_field_override_type_mismatch_rejected(self, field, value):
+        store = SessionProfileStore()
+        with pytest.raises(ValueError, match=f"{field} must be"):
+            store.set_field("BE", field, value)
+        assert store.version == 0
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(ValueError, match="Unknown profile field"):
+            SessionProfileStore().set_field("BE", "max_dept_ratio", Decimal("0.30"))
+
     def test_best_rate_cannot_exceed_average(self):
         store = SessionProfileStore()
         with pytest.raises(ValueError, match="cannot exceed"):
@@ -89,6 +129,46 @@ class TestSessionProfileStoreOverride:
             store.set_annual_rate("BE", "average", Decimal("0.001"), manual=True)
 
 
+class TestSimulationCache:
+    """run_simulation memoises on (inputs, store, store.version)."""
+
+    _INPUTS = UserInputs(
+        property_price=Decimal("350000"),
+        monthly_net_income=Decimal("6000"),
+        available_savings=Decimal("80000"),
+    )
+
+    def test_unchanged_store_reuses_outcome(self):
+        store = SessionProfileStore()
+        first = run_simulation(self._INPUTS, store)
+        assert run_simulation(self._INPUTS, store)[1] is first[1]
+
+    def test_store_update_recomputes(self):
+        store = SessionProfileStore()
+        params, result, _ = run_simulation(self._INPUTS, store)
+        store.set_annual_rate("BE", "average", Decimal("0.045"), manual=True)
+        new_params, new_result, _ = run_simulation(self._INPUTS, store)
+        assert new_params.annual_interest_rate == Decimal("0.045")
+        assert new_params.sources["annual_interest_rate"] == "profile"
+        assert new_result is not result
+        assert new_result.plan.total_interest_paid > result.plan.total_interest_paid
+
+    def test_field_update_recomputes(self):
+        store = SessionProfileStore()
+        params, _, _ = run_simulation(self._INPUTS, store)
+        store.set_field("BE", "purchase_tax_rate", Decimal("0.10"))
+        new_params, _, _ = run_simulation(self._INPUTS, store)
+        assert params.purchase_taxes == Decimal("43750.00")
+        assert new_params.purchase_taxes == Decimal("35000.00")
+
+    def test_cached_provenance_is_read_only(self):
+        params, result, _ = run_simulation(self._INPUTS, SessionProfileStore())
+        with pytest.raises(TypeError):
+            params.sources["annual_interest_rate"] = "user"
+        with pytest.raises(TypeError):
+            result.parameters_source["annual_interest_rate"] = "user"
+
+
 class TestCLIRunner:
     """Smoke tests via Click test runner (non-interactive flag paths)."""
 
@@ -131,6 +211,16 @@ class TestCLIRunner:
         # Should surface an error message (not crash with unhandled exception)
         assert "ZZ" in result.output or "Unsupported" in result.output or result.exit_code != 0
 
+    def test_non_numeric_argument_rejected(self):
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            ["--property-price", "NaN", "--income", "6000", "--savings", "80000"],
+            input="exit\n",
+        )
+        assert result.exit_code == 1
+        assert "Invalid value for --property-price" in result.output
+
     def test_insufficient_savings_shows_ineligible(self):
         runner = CliRunner()
         result = runner.invoke(
@@ -214,3 +304,34 @@ class TestCLIRunner:
         )
         assert result.exit_code == 0
         assert "300" in result.output  # 25 years = 300 months
+
+    def test_schedule_command_prints_every_period(self):
+        """The 'schedule' command prints one row per month, ending at a zero balance."""
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "--property-price", "350000",
+                "--income", "6000",
+                "--savings", "80000",
+                "--country", "BE",
+                "--duration", "25y",
+            ],
+            input="\n\nschedule\nexit\n",  # skip purchase-tax and down-payment prompts
+        )
+        assert result.exit_code == 0
+        assert "Amortization Schedule" in result.output
+        last_row = next(l for l in result.output.splitlines() if l.strip().startswith("300 "))
+        assert last_row.rstrip().endswith("0.00 EUR")
+
+    def test_update_and_reset_fields(self):
+        """'update' re-runs with the new value; 'reset' refuses mandatory fields."""
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            ["--property-price", "350000", "--income", "6000", "--savings", "80000"],
+            input="\n\nupdate\nmonthly_net_income\n7000\nreset\nproperty_price\nexit\n",
+        )
+        assert result.exit_code == 0
+        assert "42,000" in result.output  # 6-month reserve recomputed from the new income
+        assert "cannot be reset" in result.output
@@ -1,10 +1,13 @@
 """Unit tests for calculator.py — EMI, amortization, APR."""
+import random
 from decimal import Decimal
 
 import pytest
 
 from credit_simulator.calculator import (
+    _total_interest,
     build_amortization_schedule,
+    compute_apr,
     compute_emi,
     compute_loan_plan,
     compute_monthly_insurance,
@@ -104,6 +107,14 @@ class TestAmortizationSchedule:
             expected = row.principal_component + row.interest_component + row.insurance_component
             assert row.monthly_installment == expected
 
+    def test_precomputed_plan_values_give_same_schedule(self):
+        plan = compute_loan_plan(Decimal("100000"), Decimal("0.035"), Decimal("0.002"), 12)
+        schedule = build_amortization_schedule(
+            Decimal("100000"), Decimal("0.035"), Decimal("0.002"), 12,
+            emi=plan.monthly_emi, monthly_insurance=plan.monthly_insurance,
+        )
+        assert schedule == self._build()
+
 
 class TestLoanPlan:
     def test_total_repaid_equals_principal_plus_cost(self):
@@ -130,9 +141,63 @@ class TestLoanPlan:
         )
         assert plan.effective_annual_rate > ZERO
 
+    @pytest.mark.parametrize("principal,installment,months", [
+        ("50000", "1", 60),          # installments repay far less than the principal
+        ("100000", "999.99", 100),   # just short of the principal
+        ("120000", "1000", 120),     # exactly the principal: zero-rate plan
+    ])
+    def test_apr_zero_when_installments_do_not_exceed_principal(self, principal, installment, months):
+        apr = compute_apr(Decimal(principal), Decimal(installment), months)
+        assert apr == ZERO
+        assert not apr.is_signed()
+
+    @pytest.mark.parametrize("insurance", ["0", "0.002"])
+    def test_zero_rate_plan_apr_not_negative(self, insurance):
+        plan = compute_loan_plan(Decimal("100000"), ZERO, Decimal(insurance), 7)
+        assert not plan.effective_annual_rate.is_signed()
+
     def test_zero_insurance_plan(self):
         plan = compute_loan_plan(
             Decimal("100000"), Decimal("0.05"), ZERO, 60
         )
         assert plan.monthly_insurance == ZERO
         assert plan.total_insurance_paid == ZERO
+
+    @pytest.mark.parametrize("principal,annual_rate,months", [
+        ("100000", "0.035", 240),
+        ("200000", "0.032", 300),
+        ("500000", "0.050", 360),
+        ("1", "0.05", 600),
+        ("10", "0.035", 240),
+        ("50", "0.035", 300),
+        ("1", "0.0305", 240),
+        ("750000", "0.045", 600),
+    ])
+    def test_total_interest_matches_schedule(self, principal, annual_rate, months):
+        """total_interest_paid is exactly the sum of the schedule's interest column."""
+        plan = compute_loan_plan(Decimal(principal), Decimal(annual_rate), ZERO, months)
+        schedule = build_amortization_schedule(Decimal(principal), Decimal(annual_rate), ZERO, months)
+        schedule_interest = sum((row.interest_component for row in schedule), ZERO)
+        assert plan.total_interest_paid == schedule_interest
+        assert plan.total_interest_paid >= ZERO
+        assert plan.total_repaid >= plan.loan_principal
+
+    def test_total_interest_matches_schedule_random_plans(self):
+        """Same invariant over random plans, including EMIs far from the annuity value."""
+        rng = random.Random(20250901)
+        for i in range(300):
+            principal = Decimal(rng.choice([rng.randint(1, 100), rng.randint(1, 1_000_000)]))
+            annual_rate = Decimal(rng.randint(0, 900)) / 10000
+            months = rng.randint(1, 600)
+            emi = compute_emi(principal, annual_rate, months)
+            if i % 3 == 0:
+                emi = Decimal(rng.randint(1, 100_000)) / 100
+            schedule = build_amortization_schedule(principal, annual_rate, ZERO, months, emi=emi)
+            expected = sum((row.interest_component for row in schedule), ZERO)
+            assert _total_interest(principal, annual_rate / 12, emi, months) == expected, (
+                principal, annual_rate, months, emi,
+            )
+
+    def test_zero_rate_total_interest(self):
+        plan = compute_loan_plan(Decimal("120000"), ZERO, ZERO, 120)
+        assert plan.total_interest_paid == ZERO
@@ -0,0 +1,154 @@
+"""Unit tests for fetcher.py — caching and parsing with the HTTP session patched out."""
+import io
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from credit_simulator import fetcher
+from credit_simulator.fetcher import FetchError, clear_rate_cache, fetch_rate
+
+
+def _response(status: int = 200, body: bytes = b"", headers: dict | None = None) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    resp.headers.update(headers or {})
+    return resp
+
+
+def _ecb_body(percent: float) -> bytes:
+    return json.dumps(
+        {"dataSets": [{"series": {"0:0:0:0:0:0:0:0:0:0:0": {"observations": {"0": [percent]}}}}]}
+    ).encode()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_rate_cache()
+    yield
+    clear_rate_cache()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the TTL cache."""
+    now = [1000.0]
+    monkeypatch.setattr(fetcher, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def session_get(monkeypatch):
+    """Patch _SESSION.get to serve queued responses and record each call's kwargs."""
+    queue: list[requests.Response] = []
+    calls: list[dict] = []
+
+    def fake_get(url, **kwargs):
+        calls.append(kwargs)
+        return queue.pop(0)
+
+    monkeypatch.setattr(fetcher._SESSION, "get", fake_get)
+    return SimpleNamespace(queue=queue, calls=calls)
+
+
+class TestRateCache:
+    def test_ttl_hit_skips_network(self, clock, session_get):
+        session_get.queue.append(_response(body=_ecb_body(3.45)))
+        assert fetch_rate("FR") == Decimal("0.0345")
+        clock[0] += fetcher._CACHE_TTL - 1
+        assert fetch_rate("fr") == Decimal("0.0345")
+        assert len(session_get.calls) == 1
+
+    def test_ttl_expiry_refetches(self, clock, session_get):
+        session_get.queue.extend([_response(body=_ecb_body(3.45)), _response(body=_ecb_body(3.60))])
+        assert fetch_rate("FR") == Decimal("0.0345")
+        clock[0] += fetcher._CACHE_TTL
+        assert fetch_rate("FR") == Decimal("0.036")
+        assert len(session_get.calls) == 2
+
+    def test_clear_rate_cache_forces_refetch(self, clock, session_get):
+        session_get.queue.extend([_response(body=_ecb_body(3.45)), _response(body=_ecb_body(3.60))])
+        fetch_rate("FR")
+        clear_rate_cache()
+        assert fetch_rate("FR") == Decimal("0.036")
+
+
+class TestConditionalRevalidation:
+    def test_ecb_expired_entry_revalidates_with_304(self, clock, session_get):
+        session_get.queue.extend([
+            _response(body=_ecb_body(3.45), headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Sep 2025 00:00:00 GMT"}),
+            _response(status=304),
+        ])
+        assert fetch_rate("FR") == Decimal("0.0345")
+        clock[0] += fetcher._CACHE_TTL
+        assert fetch_rate("FR") == Decimal("0.0345")
+        assert session_get.calls[0]["headers"] is None
+        assert session_get.calls[1]["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Sep 2025 00:00:00 GMT",
+        }
+
+    def test_fred_expired_entry_revalidates_with_304(self, clock, session_get, monkeypatch):
+        monkeypatch.setenv("FRED_API_KEY", "test-key")
+        body = json.dumps({"observations": [{"value": "6.35"}]}).encode()
+        session_get.queue.extend([_response(body=body, headers={"ETag": '"w1"'}), _response(status=304)])
+        assert fetch_rate("US") == Decimal("0.0635")
+        clock[0] += fetcher._CACHE_TTL
+        assert fetch_rate("US") == Decimal("0.0635")
+        assert session_get.calls[1]["headers"] == {"If-None-Match": '"w1"'}
+
+    def test_no_validators_sends_no_conditional_headers(self, clock, session_get):
+        session_get.queue.extend([_response(body=_ecb_body(3.45)), _response(body=_ecb_body(3.50))])
+        fetch_rate("FR")
+        clock[0] += fetcher._CACHE_TTL
+        assert fetch_rate("FR") == Decimal("0.035")
+        assert session_get.calls[1]["headers"] is None
+
+
+class TestParsing:
+    def test_boe_csv_skips_header_and_trailing_empty_value(self, session_get):
+        raw = io.BytesIO(b"DATE,IUMTLMV\n31 Jul 2025,4.51\n31 Aug 2025,4.48\n30 Sep 2025,\n")
+        resp = _response()
+        resp._content = False  # streamed: iter_lines reads from raw
+        resp.raw = raw
+        closed = []
+        resp.close = lambda: closed.append(True)
+        session_get.queue.append(resp)
+        assert fetch_rate("GB") == Decimal("0.0448")
+        assert session_get.calls[0]["stream"] is True
+        assert closed == [True]
+
+    def test_boe_without_data_rows_raises(self, session_get):
+        resp = _response()
+        resp._content = False
+        resp.raw = io.BytesIO(b"DATE,IUMTLMV\n")
+        session_get.queue.append(resp)
+        with pytest.raises(FetchError, match="No data"):
+            fetch_rate("GB")
+
+    def test_ecb_non_json_body_raises_fetch_error(self, session_get):
+        session_get.queue.append(_response(body=b"<html>maintenance</html>"))
+        with pytest.raises(FetchError, match="Failed to parse ECB"):
+            fetch_rate("FR")
+
+    def test_fred_non_json_body_raises_fetch_error(self, session_get, monkeypatch):
+        monkeypatch.setenv("FRED_API_KEY", "test-key")
+        session_get.queue.append(_response(body=b"not json"))
+        with pytest.raises(FetchError, match="Failed to parse FRED"):
+            fetch_rate("US")
+
+    def test_failed_fetch_is_not_cached(self, session_get):
+        session_get.queue.extend([_response(body=b"not json"), _response(body=_ecb_body(3.45))])
+        with pytest.raises(FetchError):
+            fetch_rate("FR")
+        assert fetch_rate("FR") == Decimal("0.0345")
+
+
+class TestSession:
+    def test_retries_transient_gateway_errors(self):
+        retry = fetcher._SESSION.get_adapter("https://data.ecb.europa.eu").max_retries
+        assert retry.total == 2
+        assert set(retry.status_forcelist) == {502, 503, 504}
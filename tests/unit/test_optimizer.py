@@ -1,26 +1,35 @@
 """Unit tests for optimizer.py — grid search over all preference modes."""
+import dataclasses
 from decimal import Decimal
+from itertools import pairwise
 
 import pytest
 
-from credit_simulator.profiles import SessionProfileStore
-from credit_simulator.optimizer import optimize, analyze_sweet_spot
-from credit_simulator.resolver import UserInputs, resolve
-from credit_simulator.config import SWEET_SPOT_LTV_TARGET, SWEET_SPOT_RESERVE_MONTHS
+from credit_simulator.calculator import compute_loan_plan
+from credit_simulator.profiles import LtvRateTier, SessionProfileStore
+from credit_simulator.optimizer import _SCORERS, _dp_grid, optimize, analyze_sweet_spot
+from credit_simulator.resolver import InfeasibleError, UserInputs, check_feasibility, resolve
+from credit_simulator.config import SWEET_SPOT_LTV_TARGET, SWEET_SPOT_RESERVE_MONTHS, VALID_PREFERENCES_SORTED
 
 
 def _store() -> SessionProfileStore:
     return SessionProfileStore()
 
 
+_BASE_DEFAULTS = dict(
+    property_price=Decimal("350000"),
+    monthly_net_income=Decimal("6000"),
+    available_savings=Decimal("80000"),
+)
+# Sweet-spot defaults: 350k price, 6k income, 150k savings, 240 months.
+_SWEET_DEFAULTS = _BASE_DEFAULTS | dict(
+    available_savings=Decimal("150000"),
+    fixed_loan_duration_months=240,
+)
+
+
 def _inputs(**kwargs) -> UserInputs:
-    defaults = dict(
-        property_price=Decimal("350000"),
-        monthly_net_income=Decimal("6000"),
-        available_savings=Decimal("80000"),
-    )
-    defaults.update(kwargs)
-    return UserInputs(**defaults)
+    return UserInputs(**(_BASE_DEFAULTS | kwargs))
 
 
 def _run(preference: str, **inp_kwargs):
@@ -29,59 +38,65 @@ def _run(preference: str, **inp_kwargs):
     return optimize(params)
 
 
+@pytest.fixture(scope="module")
+def default_results():
+    """One optimize() run per preference on the default inputs (results are frozen)."""
+    return {pref: _run(pref) for pref in VALID_PREFERENCES_SORTED}
+
+
 class TestOptimizeMinimizeTotalCost:
-    def test_returns_result(self):
-        result = _run("minimize_total_cost")
+    def test_returns_result(self, default_results):
+        result = default_results["minimize_total_cost"]
         assert result.plan.total_cost_of_credit > Decimal("0")
 
-    def test_constraints_respected(self):
-        result = _run("minimize_total_cost")
+    def test_constraints_respected(self, default_results):
+        result = default_results["minimize_total_cost"]
         assert result.plan.monthly_installment <= Decimal("2200")
         assert result.down_payment >= Decimal("0")
 
-    def test_down_payment_within_savings(self):
-        result = _run("minimize_total_cost")
+    def test_down_payment_within_savings(self, default_results):
+        result = default_results["minimize_total_cost"]
         assert result.down_payment <= Decimal("80000")
 
 
 class TestOptimizeMinimizeMonthlyPayment:
-    def test_returns_result(self):
-        result = _run("minimize_monthly_payment")
+    def test_returns_result(self, default_results):
+        result = default_results["minimize_monthly_payment"]
         assert result.plan.monthly_installment > Decimal("0")
 
-    def test_payment_not_exceeding_cap(self):
-        result = _run("minimize_monthly_payment")
+    def test_payment_not_exceeding_cap(self, default_results):
+        result = default_results["minimize_monthly_payment"]
         assert result.plan.monthly_installment <= Decimal("2200")
 
 
 class TestOptimizeMinimizeDuration:
-    def test_shorter_than_default(self):
-        result_dur = _run("minimize_duration")
-        result_cost = _run("minimize_total_cost")
+    def test_shorter_than_default(self, default_results):
+        result_dur = default_results["minimize_duration"]
+        result_cost = default_results["minimize_total_cost"]
         # minimize_duration should generally pick a shorter or equal duration
         assert result_dur.loan_duration_months <= result_cost.loan_duration_months + 12
 
 
 class TestOptimizeMinimizeDownPayment:
-    def test_smallest_feasible_down_payment(self):
-        result = _run("minimize_down_payment")
+    def test_smallest_feasible_down_payment(self, default_results):
+        result = default_results["minimize_down_payment"]
         # Down payment should be close to minimum
         inputs = _inputs(optimization_preference="minimize_down_payment")
         params = resolve(inputs, _store())
         assert result.down_payment >= params.min_down_payment
 
-    def test_loan_principal_is_positive(self):
-        result = _run("minimize_down_payment")
+    def test_loan_principal_is_positive(self, default_results):
+        result = default_results["minimize_down_payment"]
         assert result.loan_principal > Decimal("0")
 
 
 class TestOptimizeBalanced:
-    def test_returns_result(self):
-        result = _run("balanced")
+    def test_returns_result(self, default_results):
+        result = default_results["balanced"]
         assert result.plan is not None
 
-    def test_metadata(self):
-        result = _run("balanced")
+    def test_metadata(self, default_results):
+        result = default_results["balanced"]
         assert result.country == "BE"
         assert result.currency == "EUR"
         assert result.optimization_preference == "balanced"
@@ -93,7 +108,6 @@ class TestOptimizeFranceExample:
 
     def test_france_infeasible_low_income(self):
         """§7.2 exact inputs: loan of ~467–499k is unaffordable on 5500 income at 35% cap."""
-        from credit_simulator.resolver import InfeasibleError, check_feasibility
         inputs = _inputs(
             optimization_preference="minimize_total_cost",
             property_price=Decimal("499000"),
@@ -124,6 +138,62 @@ class TestOptimizeFranceExample:
         assert Decimal("0") < result.ltv_ratio <= Decimal("1")
 
 
+def _exhaustive_best(params):
+    """Reference optimum: score every feasible grid cell, no pruning."""
+    cap = min(params.monthly_net_income * params.max_debt_ratio, params.max_monthly_payment)
+    duration = params.fixed_loan_duration_months
+    best = None
+    for dp in _dp_grid(params.min_down_payment, params.available_savings):
+        principal = params.total_acquisition_cost - dp
+        if principal <= Decimal("0"):
+            continue
+        rate = params.rate_for_ltv(principal / params.property_price)
+        plan = compute_loan_plan(principal, rate, params.insurance_rate, duration)
+        if plan.monthly_installment > cap:
+            continue
+        score = _SCORERS[params.optimization_preference](plan, dp, duration)
+        if best is None or score < best[0]:
+            best = (score, dp)
+    return best[1]
+
+
+class TestOptimizePruning:
+    """The early-exit scan must pick the same plan as a full grid evaluation."""
+
+    @pytest.mark.parametrize("preference", [
+        "minimize_total_cost", "minimize_monthly_payment", "minimize_down_payment", "balanced",
+    ])
+    @pytest.mark.parametrize("country,price,income,savings", [
+        ("BE", "350000", "6000", "80000.50"),
+        ("BE", "499000", "6000", "300000"),
+        ("FR", "300000", "4000", "120000"),
+        ("GB", "400000", "9000", "250000"),
+        ("BE", "350000", "4500", "200000"),   # cap binds well above the minimum
+    ])
+    def test_matches_exhaustive_search(self, preference, country, price, income, savings):
+        params = resolve(_inputs(
+            optimization_preference=preference,
+            country=country,
+            property_price=Decimal(price),
+            monthly_net_income=Decimal(income),
+            available_savings=Decimal(savings),
+        ), _store())
+        assert optimize(params).down_payment == _exhaustive_best(params)
+
+    def test_non_monotone_tiers_fall_back_to_full_scan(self):
+        params = resolve(_inputs(
+            optimization_preference="minimize_total_cost",
+            monthly_net_income=Decimal("10000"),
+            available_savings=Decimal("200000"),
+        ), _store())
+        # A rate that drops as LTV rises breaks the monotonicity the pruning relies on.
+        params = dataclasses.replace(params, ltv_rate_tiers=(
+            LtvRateTier(ltv_max=Decimal("0.80"), rate_delta=Decimal("0.02")),
+            LtvRateTier(ltv_max=Decimal("1.00"), rate_delta=Decimal("-0.01")),
+        ))
+        assert optimize(params).down_payment == _exhaustive_best(params)
+
+
 class TestOptimizeInvalidPreference:
     def test_raises_on_unknown_preference(self):
         inputs = _inputs(optimization_preference="unknown_pref")
@@ -167,73 +237,66 @@ class TestOptimizerDTIConstraint:
         assert result.plan.monthly_installment <= Decimal("2200.01")
 
 
+@pytest.fixture(scope="module")
+def default_params():
+    return resolve(UserInputs(**_SWEET_DEFAULTS), _store())
+
+
+@pytest.fixture(scope="module")
+def default_analysis(default_params):
+    return analyze_sweet_spot(default_params)
+
+
 class TestAnalyzeSweetSpot:
     """Unit tests for the opportunity-cost-based sweet-spot analysis."""
 
     def _params(self, **kwargs):
-        defaults = dict(
-            property_price=Decimal("350000"),
-            monthly_net_income=Decimal("6000"),
-            available_savings=Decimal("150000"),
-            fixed_loan_duration_months=240,
-        )
-        defaults.update(kwargs)
-        inputs = UserInputs(**defaults)
-        return resolve(inputs, _store())
+        return resolve(UserInputs(**(_SWEET_DEFAULTS | kwargs)), _store())
 
     # --- Structural invariants ---
 
-    def test_returns_at_least_two_milestones(self):
-        analysis = analyze_sweet_spot(self._params())
-        assert len(analysis.milestones) >= 2
+    def test_returns_at_least_two_milestones(self, default_analysis):
+        assert len(default_analysis.milestones) >= 2
 
-    def test_always_includes_minimum_and_maximum(self):
-        analysis = analyze_sweet_spot(self._params())
-        labels = [m.label for m in analysis.milestones]
+    def test_always_includes_minimum_and_maximum(self, default_analysis):
+        labels = [m.label for m in default_analysis.milestones]
         assert any("Minimum" in l for l in labels)
         assert any("Maximum" in l for l in labels)
 
-    def test_exactly_one_sweet_spot(self):
-        analysis = analyze_sweet_spot(self._params())
-        assert len([m for m in analysis.milestones if m.is_sweet_spot]) == 1
+    def test_exactly_one_sweet_spot(self, default_analysis):
+        assert len([m for m in default_analysis.milestones if m.is_sweet_spot]) == 1
 
-    def test_milestones_ordered_by_down_payment(self):
-        analysis = analyze_sweet_spot(self._params())
-        dps = [m.down_payment for m in analysis.milestones]
+    def test_milestones_ordered_by_down_payment(self, default_analysis):
+        dps = [m.down_payment for m in default_analysis.milestones]
         assert dps == sorted(dps)
 
-    def test_total_cost_decreases_with_down_payment(self):
-        analysis = analyze_sweet_spot(self._params())
-        costs = [m.plan.total_cost_of_credit for m in analysis.milestones]
-        assert all(costs[i] >= costs[i + 1] for i in range(len(costs) - 1))
+    def test_total_cost_decreases_with_down_payment(self, default_analysis):
+        costs = [m.plan.total_cost_of_credit for m in default_analysis.milestones]
+        assert all(a >= b for a, b in pairwise(costs))
 
-    def test_sweet_spot_within_savings_bounds(self):
-        params = self._params()
-        analysis = analyze_sweet_spot(params)
-        sweet = next(m for m in analysis.milestones if m.is_sweet_spot)
-        assert sweet.down_payment >= params.min_down_payment
-        assert sweet.down_payment <= params.available_savings
+    def test_sweet_spot_within_savings_bounds(self, default_params, default_analysis):
+        sweet = next(m for m in default_analysis.milestones if m.is_sweet_spot)
+        assert sweet.down_payment >= default_params.min_down_payment
+        assert sweet.down_payment <= default_params.available_savings
 
     def test_duration_echoed(self):
         analysis = analyze_sweet_spot(self._params(fixed_loan_duration_months=180))
         assert analysis.duration_months == 180
 
-    def test_reason_and_marginal_fields_non_empty(self):
-        analysis = analyze_sweet_spot(self._params())
-        assert analysis.sweet_spot_reason != ""
-        assert analysis.marginal_saving_per_1k > Decimal("0")
-        assert analysis.effective_annual_yield > Decimal("0")
+    def test_reason_and_marginal_fields_non_empty(self, default_analysis):
+        assert default_analysis.sweet_spot_reason != ""
+        assert default_analysis.marginal_saving_per_1k > Decimal("0")
+        assert default_analysis.effective_annual_yield > Decimal("0")
 
     # --- Opportunity-cost logic ---
 
-    def test_sweet_spot_is_minimum_when_opp_cost_exceeds_yield(self):
+    def test_sweet_spot_is_minimum_when_opp_cost_exceeds_yield(self, default_params):
         # Force opportunity cost >> loan APR so minimum down is optimal.
         # Default params: 350k price → min LTV exactly 90% (base tier, no surcharge),
         # so effective_floor_dp == min_down_payment.
-        params = self._params()
-        analysis = analyze_sweet_spot(params, opportunity_cost_rate=Decimal("0.20"))
+        analysis = analyze_sweet_spot(default_params, opportunity_cost_rate=Decimal("0.20"))
         sweet = next(m for m in analysis.milestones if m.is_sweet_spot)
-        assert sweet.down_payment == params.min_down_payment
+        assert sweet.down_payment == default_params.min_down_payment
         assert analysis.down_payment_is_efficient is False
 
     def test_sweet_spot_exits_surcharge_zone(self):
@@ -257,31 +320,27 @@ class TestAnalyzeSweetSpot:
         ltv = principal / params.property_price
         assert ltv <= Decimal("0.90")
 
-    def test_sweet_spot_is_reserve_ceiling_when_yield_exceeds_opp_cost(self):
+    def test_sweet_spot_is_reserve_ceiling_when_yield_exceeds_opp_cost(self, default_params):
         # Force opportunity cost << loan APR so maximising down is optimal
-        params = self._params()
-        analysis = analyze_sweet_spot(params, opportunity_cost_rate=Decimal("0.001"))
+        analysis = analyze_sweet_spot(default_params, opportunity_cost_rate=Decimal("0.001"))
         sweet = next(m for m in analysis.milestones if m.is_sweet_spot)
-        reserve_ceiling = params.available_savings - SWEET_SPOT_RESERVE_MONTHS * params.monthly_net_income
+        reserve_ceiling = default_params.available_savings - SWEET_SPOT_RESERVE_MONTHS * default_params.monthly_net_income
         assert sweet.down_payment <= reserve_ceiling
         assert analysis.down_payment_is_efficient is True
 
-    def test_marginal_saving_matches_direct_calculation(self):
+    def test_marginal_saving_matches_direct_calculation(self, default_params, default_analysis):
         # Verify that marginal_saving_per_1k matches a direct calculation using
         # LTV-adjusted rates (constant within a single LTV tier, larger at crossings).
-        params = self._params()
-        analysis = analyze_sweet_spot(params)
-        from credit_simulator.calculator import compute_loan_plan
-        p1 = params.total_acquisition_cost - params.min_down_payment
+        p1 = default_params.total_acquisition_cost - default_params.min_down_payment
         p2 = p1 - Decimal("1000")
-        ltv1 = p1 / params.property_price
-        ltv2 = p2 / params.property_price
-        plan1 = compute_loan_plan(p1, params.rate_for_ltv(ltv1), params.insurance_rate, 240)
-        plan2 = compute_loan_plan(p2, params.rate_for_ltv(ltv2), params.insurance_rate, 240)
+        ltv1 = p1 / default_params.property_price
+        ltv2 = p2 / default_params.property_price
+        plan1 = compute_loan_plan(p1, default_params.rate_for_ltv(ltv1), default_params.insurance_rate, 240)
+        plan2 = compute_loan_plan(p2, default_params.rate_for_ltv(ltv2), default_params.insurance_rate, 240)
         expected_per_1k = plan1.total_cost_of_credit - plan2.total_cost_of_credit
         # The analyzer computes marginal_saving_per_1k with the same 1 k step, so
         # results must agree to within 1 EUR (pure Decimal rounding, no nonlinearity).
-        assert abs(analysis.marginal_saving_per_1k - expected_per_1k) <= Decimal("1")
+        assert abs(default_analysis.marginal_saving_per_1k - expected_per_1k) <= Decimal("1")
 
     def test_reserve_warning_when_min_dp_exceeds_buffer(self):
         # Very low income → reserve floor is tiny → min down payment may exceed it
@@ -307,17 +366,10 @@ class TestSweetSpotPreferredDownPayment:
     """Tests for preferred_down_payment milestone rendering in sweet-spot analysis."""
 
     def _params(self, preferred_down_payment=None, **kwargs):
-        defaults = dict(
-            property_price=Decimal("350000"),
-            monthly_net_income=Decimal("6000"),
-            available_savings=Decimal("150000"),
-            fixed_loan_duration_months=240,
-        )
-        defaults.update(kwargs)
+        defaults = _SWEET_DEFAULTS | kwargs
         if preferred_down_payment is not None:
             defaults["preferred_down_payment"] = preferred_down_payment
         inputs = UserInputs(**defaults)
-        from credit_simulator.profiles import SessionProfileStore
         return resolve(inputs, SessionProfileStore())
 
     def test_preferred_dp_adds_your_choice_milestone(self):
@@ -369,7 +421,6 @@ class TestOptimizePreferredDownPayment:
         )
         defaults.update(kwargs)
         inputs = UserInputs(**defaults)
-        from credit_simulator.profiles import SessionProfileStore
         params = resolve(inputs, SessionProfileStore())
         return optimize(params)
 
@@ -1,10 +1,12 @@
 """Unit tests for resolver.py — parameter resolution and feasibility."""
+from dataclasses import replace
 from decimal import Decimal
 
 import pytest
 
-from credit_simulator.profiles import SessionProfileStore
-from credit_simulator.resolver import InfeasibleError, ResolvedParams, UserInputs, check_feasibility, resolve
+from credit_simulator.config import DEFAULT_MAX_MONTHLY_PAYMENT
+from credit_simulator.profiles import LtvRateTier, SessionProfileStore, get_profile
+from credit_simulator.resolver import InfeasibleError, UserInputs, check_feasibility, resolve
 
 ZERO = Decimal("0")
 
@@ -13,45 +15,46 @@ def _store() -> SessionProfileStore:
     return SessionProfileStore()
 
 
+_BASE_DEFAULTS = dict(
+    property_price=Decimal("350000"),
+    monthly_net_income=Decimal("6000"),
+    available_savings=Decimal("80000"),
+)
+
+
 def _base_inputs(**kwargs) -> UserInputs:
-    defaults = dict(
-        property_price=Decimal("350000"),
-        monthly_net_income=Decimal("6000"),
-        available_savings=Decimal("80000"),
-    )
-    defaults.update(kwargs)
-    return UserInputs(**defaults)
+    return UserInputs(**(_BASE_DEFAULTS | kwargs))
+
+
+@pytest.fixture(scope="module")
+def default_params():
+    return resolve(_base_inputs(), _store())
 
 
 class TestResolveDefaults:
-    def test_default_country_is_be(self):
-        params = resolve(_base_inputs(), _store())
-        assert params.country == "BE"
+    def test_default_country_is_be(self, default_params):
+        assert default_params.country == "BE"
 
-    def test_default_quality_is_average(self):
-        params = resolve(_base_inputs(), _store())
-        assert params.profile_quality == "average"
+    def test_default_quality_is_average(self, default_params):
+        assert default_params.profile_quality == "average"
 
-    def test_purchase_taxes_estimated_from_profile(self):
-        params = resolve(_base_inputs(), _store())
+    def test_purchase_taxes_estimated_from_profile(self, default_params):
         # BE purchase_tax_rate = 12.5%
         expected = Decimal("350000") * Decimal("0.125")
-        assert params.purchase_taxes == expected.quantize(Decimal("0.01"))
-        assert params.sources["purchase_taxes"] == "profile"
+        assert default_params.purchase_taxes == expected.quantize(Decimal("0.01"))
+        assert default_params.sources["purchase_taxes"] == "profile"
 
     def test_purchase_taxes_user_override(self):
         params = resolve(_base_inputs(purchase_taxes=Decimal("40000")), _store())
         assert params.purchase_taxes == Decimal("40000")
         assert params.sources["purchase_taxes"] == "user"
 
-    def test_total_acquisition_cost(self):
-        params = resolve(_base_inputs(), _store())
-        assert params.total_acquisition_cost == params.property_price + params.purchase_taxes
+    def test_total_acquisition_cost(self, default_params):
+        assert default_params.total_acquisition_cost == default_params.property_price + default_params.purchase_taxes
 
-    def test_loan_params_from_profile(self):
-        params = resolve(_base_inputs(), _store())
-        assert params.sources["annual_interest_rate"] == "profile"
-        assert params.sources["insurance_rate"] == "profile"
+    def test_loan_params_from_profile(self, default_params):
+        assert default_params.sources["annual_interest_rate"] == "profile"
+        assert default_params.sources["insurance_rate"] == "profile"
 
     def test_loan_params_user_override(self):
         params = resolve(
@@ -76,18 +79,48 @@ class TestResolveDefaults:
         # min_dp = max(68000, 567000 * 0) = 68000
         assert params.min_down_payment == Decimal("68000")
 
+    def test_sources_are_read_only(self, default_params):
+        with pytest.raises(TypeError):
+            default_params.sources["purchase_taxes"] = "user"
+
     def test_unsupported_country(self):
         with pytest.raises(ValueError, match="Unsupported country"):
             resolve(_base_inputs(country="ZZ"), _store())
 
+    def test_unknown_profile_quality(self):
+        with pytest.raises(ValueError, match="Unknown profile quality 'Best'"):
+            resolve(_base_inputs(profile_quality="Best"), _store())
 
-class TestFeasibility:
-    def _params(self, **kwargs) -> ResolvedParams:
-        return resolve(_base_inputs(**kwargs), _store())
 
-    def test_feasible_passes(self):
-        params = self._params()
-        check_feasibility(params)  # should not raise
+class TestRateForLtv:
+    @pytest.mark.parametrize("ltv", ["0.50", "0.75", "0.76", "0.80", "0.85", "0.90", "0.95", "1.00", "1.20"])
+    def test_matches_profile_tier_lookup(self, ltv):
+        store = _store()
+        params = resolve(_base_inputs(), store)
+        expected = store.get_rate_for_ltv("BE", "average", Decimal(ltv))
+        assert params.rate_for_ltv(Decimal(ltv)) == expected
+
+    def test_no_tiers_returns_base_rate(self, default_params):
+        params = replace(default_params, ltv_rate_tiers=())
+        assert params.rate_for_ltv(Decimal("0.95")) == params.annual_interest_rate
+
+    @pytest.mark.parametrize("ltv", ["0.50", "0.80", "0.85", "1.00", "1.20"])
+    def test_matches_country_profile(self, default_params, ltv):
+        expected = get_profile("BE").rate_for_ltv(Decimal(ltv), "average")
+        assert default_params.rate_for_ltv(Decimal(ltv)) == expected
+
+    @pytest.mark.parametrize("maxes", [("0.90", "0.80"), ("0.80", "0.80")])
+    def test_unsorted_tiers_rejected(self, default_params, maxes):
+        tiers = tuple(LtvRateTier(Decimal(m), ZERO) for m in maxes)
+        with pytest.raises(ValueError, match="strictly ascending"):
+            replace(default_params, ltv_rate_tiers=tiers)
+        with pytest.raises(ValueError, match="strictly ascending"):
+            replace(get_profile("BE"), ltv_rate_tiers=tiers)
+
+
+class TestFeasibility:
+    def test_feasible_passes(self, default_params):
+        check_feasibility(default_params)  # should not raise
 
     def test_insufficient_savings(self):
         params = resolve(
@@ -109,10 +142,9 @@ class TestFeasibility:
         with pytest.raises(InfeasibleError, match="Monthly payment"):
             check_feasibility(params)
 
-    def test_default_max_debt_ratio_from_profile(self):
-        params = self._params()
+    def test_default_max_debt_ratio_from_profile(self, default_params):
         # BE profile max_debt_ratio = 35%
-        assert params.max_debt_ratio == Decimal("0.35")
+        assert default_params.max_debt_ratio == Decimal("0.35")
 
     def test_user_max_debt_ratio_overrides_profile(self):
         params = resolve(_base_inputs(max_debt_ratio=Decimal("0.28")), _store())
@@ -130,7 +162,11 @@ class TestFeasibility:
             _base_inputs(monthly_net_income=Decimal("4000"), available_savings=Decimal("100000")),
             _store(),
         )
-        from credit_simulator.config import DEFAULT_MAX_MONTHLY_PAYMENT
         effective_cap = min(params.monthly_net_income * params.max_debt_ratio, params.max_monthly_payment)
         assert effective_cap == Decimal("1400")
         assert effective_cap < DEFAULT_MAX_MONTHLY_PAYMENT
+        assert params.effective_monthly_cap == effective_cap
+
+    def test_effective_monthly_cap_follows_replace(self, default_params):
+        params = replace(default_params, monthly_net_income=Decimal("2000"))
+        assert params.effective_monthly_cap == Decimal("700")